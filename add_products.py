@@ -6,9 +6,11 @@ Complete workflow for adding products from Excel to database
 
 import sys
 import time
+from sqlalchemy import func, distinct
 from models import get_session, Product, ProductCompatibility
 from db_sync_service import sync_database_from_excel
 from incremental_compute import compute_incremental
+import redis_cache
 
 
 def add_products_from_excel(excel_path: str = 'data/Product Data.xlsx', 
@@ -40,7 +42,14 @@ def add_products_from_excel(excel_path: str = 'data/Product Data.xlsx',
     start_time = time.time()
     
     try:
-        added, updated, deleted = sync_database_from_excel(excel_path)
+        sync_result = sync_database_from_excel(excel_path)
+        added = sync_result['products_added']
+        updated = sync_result['products_updated']
+        deleted = sync_result['products_deleted']
+        
+        # Cached compatibility results may describe products that just changed
+        if added or updated or deleted:
+            redis_cache.delete_prefix(redis_cache.COMPAT_KEY_PREFIX)
         
         sync_time = time.time() - start_time
         
@@ -101,14 +110,16 @@ def show_status():
     """Show current database status"""
     session = get_session()
     
-    total_products = session.query(Product).count()
-    processed_products = session.query(ProductCompatibility.base_product_id).distinct().count()
-    total_compatibilities = session.query(ProductCompatibility).count()
-    new_products = session.query(Product).filter(
-        ~Product.id.in_(
-            session.query(ProductCompatibility.base_product_id).distinct()
-        )
-    ).count()
+    # Single round-trip: the LEFT JOIN anti-join replaces the NOT IN subquery,
+    # and conditional aggregates collect every count from the same scan
+    total_products, processed_products, total_compatibilities, new_products = session.query(
+        func.count(distinct(Product.id)),
+        func.count(distinct(ProductCompatibility.base_product_id)),
+        func.count(ProductCompatibility.id),
+        func.count(distinct(Product.id)).filter(ProductCompatibility.base_product_id.is_(None)),
+    ).select_from(Product).outerjoin(
+        ProductCompatibility, Product.id == ProductCompatibility.base_product_id
+    ).one()
     
     session.close()
     
@@ -1,13 +1,21 @@
 import os
+import hashlib
+import json
 import logging
 import threading
+import time
+from collections import OrderedDict, defaultdict
 from functools import lru_cache
 from flask import Flask, render_template, request, jsonify, send_file, abort
+from flask.json.provider import JSONProvider
+import numpy as np
 import pandas as pd
+import xlsxwriter
 import io
 import traceback
 from logic import compatibility
 import data_loader
+import redis_cache
 
 # Try to import the data update service
 try:
@@ -16,6 +24,20 @@ try:
 except ImportError:
     data_service_available = False
 
+# Try to import orjson for faster JSON responses
+try:
+    import orjson
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
+# Try to import Flask-Compress for gzip-compressed JSON responses
+try:
+    from flask_compress import Compress
+    compress_available = True
+except ImportError:
+    compress_available = False
+
 # Configure app
 app = Flask(__name__)
 app.secret_key = os.environ.get("SESSION_SECRET", "dev-secret-key")
@@ -27,31 +49,341 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# In-memory cache for API responses (LRU cache with 1000 entries)
-_api_cache = {}
-_cache_lock = threading.Lock()
+
+def _json_default(obj):
+    """Serialize values the JSON encoder does not handle natively"""
+    if hasattr(obj, 'isoformat'):  # Handle date/time objects
+        return obj.isoformat()
+    return str(obj)
+
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider that encodes responses with orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return self._dumps_bytes(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand the encoded bytes straight to the response, skipping the str copy
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dumps_bytes(obj), mimetype="application/json")
+
+    def _dumps_bytes(self, obj):
+        # Keys stay sorted to match Flask's default provider
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS,
+        )
+
+
+# Configure the JSON encoder once instead of per request
+if orjson_available:
+    app.json = ORJSONProvider(app)
+    logger.info("Using orjson for JSON responses")
+else:
+    app.json.default = _json_default
+
+# Compress only the large JSON endpoints, opted in with @compressed(); applying
+# it app-wide would rewrite the ETags /search and /suggest validate against
+if compress_available:
+    app.config['COMPRESS_REGISTER'] = False
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_LEVEL'] = 6
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    # Compressed responses carry a "<etag>:gzip" ETag, so Flask-Compress re-checks
+    # If-None-Match against it to keep answering revalidations with 304
+    app.config['COMPRESS_EVALUATE_CONDITIONAL_REQUEST'] = True
+    compressed = Compress(app).compressed
+else:
+    def compressed():
+        """No-op stand-in for Compress.compressed when Flask-Compress is not installed"""
+        return lambda view: view
+
+# In-memory cache of encoded API response bodies and their ETags (LRU cache with 1000 entries),
+# split into shards with their own lock so concurrent requests rarely wait on each other.
+# Entries expire after _cache_ttl_seconds, since database writes happen in other processes
 _cache_max_size = 1000
+_cache_shard_count = 8
+_cache_ttl_seconds = 60.0
+_api_cache_shards = [(OrderedDict(), threading.Lock()) for _ in range(_cache_shard_count)]
+
+def _cache_shard(cache_key):
+    """Return the (entries, lock) shard a cache key belongs to"""
+    return _api_cache_shards[hash(cache_key) % _cache_shard_count]
+
+def _store_local(cache_key, cached):
+    """Insert into the in-process shard with LRU eviction"""
+    entries, lock = _cache_shard(cache_key)
+    with lock:
+        entries[cache_key] = (time.monotonic() + _cache_ttl_seconds, cached)
+        entries.move_to_end(cache_key)
+        if len(entries) > _cache_max_size // _cache_shard_count:
+            # Remove the shard's least recently used entry
+            entries.popitem(last=False)
 
 def get_cached_compatibles(cache_key):
-    """Get cached compatible products response"""
-    with _cache_lock:
-        return _api_cache.get(cache_key)
-
-def cache_compatibles(cache_key, data):
-    """Cache compatible products response with LRU eviction"""
-    with _cache_lock:
-        if len(_api_cache) >= _cache_max_size:
-            # Remove oldest entry (simple FIFO for now)
-            oldest = next(iter(_api_cache))
-            del _api_cache[oldest]
-        _api_cache[cache_key] = data
+    """Get cached compatible products (response body, ETag)"""
+    entries, lock = _cache_shard(cache_key)
+    with lock:
+        entry = entries.get(cache_key)
+        if entry is not None:
+            expires, cached = entry
+            if time.monotonic() < expires:
+                entries.move_to_end(cache_key)
+                return cached
+            del entries[cache_key]
+
+    # Shared Redis tier (when configured), so a response built by one worker serves them all
+    stored = redis_cache.get_value(f"{redis_cache.API_COMPAT_KEY_PREFIX}{cache_key}")
+    if stored is None:
+        return None
+    etag, _, body = stored.partition(b"\n")
+    cached = (body, etag.decode())
+    _store_local(cache_key, cached)
+    return cached
+
+def cache_compatibles(cache_key, cached):
+    """Cache compatible products (response body, ETag) in process and in Redis"""
+    _store_local(cache_key, cached)
+    body, etag = cached
+    # The hex ETag never contains a newline, so it prefixes the body unambiguously
+    redis_cache.set_value(f"{redis_cache.API_COMPAT_KEY_PREFIX}{cache_key}", etag.encode() + b"\n" + body,
+                          redis_cache.API_COMPAT_TTL_SECONDS)
 
 def clear_api_cache():
     """Clear all cached API responses (call after data updates)"""
-    global _api_cache
-    with _cache_lock:
-        _api_cache.clear()
-        logger.info("API cache cleared")
+    for entries, lock in _api_cache_shards:
+        with lock:
+            entries.clear()
+    _find_compatible_products_cached.cache_clear()
+    _excel_search_response_body.cache_clear()
+    redis_cache.delete_prefix(redis_cache.COMPAT_KEY_PREFIX)
+    redis_cache.delete_prefix(redis_cache.API_COMPAT_KEY_PREFIX)
+    data_loader.clear_known_skus()
+    logger.info("API cache cleared")
+
+
+def _may_exist_in_database(*skus):
+    """False only if none of the SKUs is in the database, usually answered without a query"""
+    candidates = [sku.upper() for sku in skus if sku]
+    known_skus = data_loader.get_known_skus()
+    if known_skus is not None and known_skus.isdisjoint(candidates):
+        # Products are inserted by other processes (webhook worker, syncs), so a
+        # miss reloads a set older than a few seconds before it is trusted
+        known_skus = data_loader.get_known_skus(data_loader.KNOWN_SKUS_MISS_RELOAD_SECONDS)
+    # Without the SKU set, fall through to the regular lookup
+    return known_skus is None or not known_skus.isdisjoint(candidates)
+
+
+@lru_cache(maxsize=4096)
+def _find_compatible_products_cached(sku, data_version):
+    """Memoize the live compatibility lookup per SKU and data version"""
+    if data_version is None:
+        # Without a version, results from other workers could come from other data
+        return compatibility.find_compatible_products(sku)
+
+    # Shared Redis cache (when configured) so workers on the same data reuse each
+    # other's results; keys of older versions simply expire
+    redis_key = f"{redis_cache.COMPAT_KEY_PREFIX}{data_version}:{sku}"
+    cached = redis_cache.get_value(redis_key)
+    if cached is not None:
+        return app.json.loads(cached)
+
+    result = compatibility.find_compatible_products(sku)
+    redis_cache.set_value(redis_key, app.json.dumps(result))
+    return result
+
+
+def get_data_version():
+    """Content-derived version of the loaded product data, the same in every worker"""
+    if data_service_available:
+        return data_update_service.get_data_version()
+    return compatibility.get_file_data_version()
+
+
+def find_compatible_products(sku):
+    """Cached compatibility lookup for a stripped, upper-case SKU; callers must not mutate the result"""
+    # Entries computed against an older data load are never hit again
+    return _find_compatible_products_cached(sku, get_data_version())
+
+# SKU -> product name lookup for the /suggest Excel fallback, rebuilt only
+# when load_data() hands back different DataFrames
+_suggest_index = {'version': 0, 'frames': (), 'sku_names': {}, 'names_upper': {}, 'sku_trigrams': {}, 'name_trigrams': {}}
+
+
+def _build_trigram_index(strings_by_sku):
+    """Map every 3-character substring to the set of SKUs whose string contains it"""
+    index = defaultdict(set)
+    for sku, text in strings_by_sku.items():
+        for i in range(len(text) - 2):
+            index[text[i:i + 3]].add(sku)
+    return dict(index)
+
+
+def _trigram_candidates(index, query):
+    """SKUs whose indexed string contains every trigram of query (query must be 3+ chars)"""
+    postings = [index.get(query[i:i + 3]) for i in range(len(query) - 2)]
+    if not all(postings):
+        return set()
+    # Intersect starting from the smallest posting list
+    postings.sort(key=len)
+    return set.intersection(*postings)
+
+
+def _same_frames(frames, cached_frames):
+    """True when load_data() handed back the very DataFrames a cache was built from"""
+    return len(frames) == len(cached_frames) and all(a is b for a, b in zip(frames, cached_frames))
+
+
+def get_suggest_index(data):
+    """Return the suggestion lookup for the given sheets, building it once per data load"""
+    global _suggest_index
+    frames = tuple(data.values())
+    cached = _suggest_index
+    if _same_frames(frames, cached['frames']):
+        return cached
+
+    sku_names = {}
+    for df in frames:
+        if 'Unique ID' in df.columns:
+            skus = df['Unique ID'].astype(str).tolist()
+            if 'Product Name' in df.columns:
+                names = df['Product Name'].astype(str).tolist()
+            else:
+                names = [''] * len(skus)
+            sku_names.update(zip(skus, names))
+
+    names_upper = {sku: name.upper() for sku, name in sku_names.items()}
+    _suggest_index = {
+        # Bumped on every rebuild so memoized suggestions from older data are never hit
+        'version': cached['version'] + 1,
+        'frames': frames,
+        'sku_names': sku_names,
+        'names_upper': names_upper,
+        'sku_trigrams': _build_trigram_index({sku: sku for sku in sku_names}),
+        'name_trigrams': _build_trigram_index(names_upper),
+    }
+    return _suggest_index
+
+
+def _nan_to_none_record(record):
+    """Copy a flat record with NaN floats replaced by None"""
+    # NaN is the only float that is not equal to itself; a type check and a
+    # comparison per value instead of pd.isna's generic dispatch
+    return {k: None if isinstance(v, float) and v != v else v for k, v in record.items()}
+
+
+# Per-sheet copies of the product DataFrames with NaN replaced by None, plus an
+# upper-cased SKU -> (sheet, row position) index and lower-cased brand
+# categoricals, used by the /api/product and /api/products Excel fallbacks;
+# rebuilt only when load_data() hands back different DataFrames
+_product_tables = {'frames': (), 'clean': {}, 'sku_rows': {}, 'brands': {}}
+
+
+def get_product_tables(data):
+    """Return the NaN-free product tables for the given sheets, building them once per data load"""
+    global _product_tables
+    frames = tuple(data.values())
+    cached = _product_tables
+    if _same_frames(frames, cached['frames']):
+        return cached
+
+    # One vectorized mask per sheet instead of a pd.isna call per cell per request
+    clean = {
+        sheet_name: df.astype(object).where(df.notna(), None)
+        for sheet_name, df in data.items()
+        if 'Unique ID' in df.columns
+    }
+
+    # First occurrence wins, matching the old sheet-by-sheet scan order
+    sku_rows = {}
+    for sheet_name, df in data.items():
+        if sheet_name in clean:
+            skus = df['Unique ID'].astype(str).str.upper().tolist()
+            for position, sku in enumerate(skus):
+                sku_rows.setdefault(sku, (sheet_name, position))
+
+    # Missing brands become 'nan', matching how str() rendered the raw cells
+    brands = {
+        sheet_name: pd.Categorical(data[sheet_name]['Brand'].astype(str).str.lower())
+        for sheet_name in clean
+        if 'Brand' in data[sheet_name].columns
+    }
+
+    _product_tables = {'frames': frames, 'clean': clean, 'sku_rows': sku_rows, 'brands': brands}
+    return _product_tables
+
+
+# Row counts reported by /api/categories and /api/health, rebuilt only when
+# load_data() hands back different DataFrames. The placeholder frame never
+# matches, so even an empty load builds the encoded /api/categories body
+_product_counts = {'frames': (None,), 'categories': [], 'total_products': 0, 'sheet_count': 0}
+
+
+def get_product_counts(data):
+    """Return per-category and total product counts for the given sheets, computed once per data load"""
+    global _product_counts
+    frames = tuple(data.values())
+    cached = _product_counts
+    if _same_frames(frames, cached['frames']):
+        return cached
+
+    categories = [
+        {'name': sheet_name, 'product_count': len(df)}
+        for sheet_name, df in data.items()
+        if 'Unique ID' in df.columns
+    ]
+    # /api/categories only changes on reload, so its body and ETag are encoded here once
+    categories_body = app.json.response({
+        'success': True,
+        'categories': categories,
+        'total_categories': len(categories)
+    }).get_data()
+    _product_counts = {
+        'frames': frames,
+        'categories': categories,
+        'categories_body': categories_body,
+        'categories_etag': hashlib.blake2b(categories_body, digest_size=8).hexdigest(),
+        'total_products': sum(len(df) for df in frames),
+        'sheet_count': len(frames),
+    }
+    return _product_counts
+
+
+@lru_cache(maxsize=512)
+def _excel_suggestions(query, index_version):
+    """Memoized (skus, display strings) for a query against the current suggestion index"""
+    suggest_index = _suggest_index
+    sku_product_map = suggest_index['sku_names']
+
+    # Trigram postings narrow the catalog to a few candidates; the
+    # substring check then confirms each one
+    names_upper = suggest_index['names_upper']
+    matching_skus_by_id = {
+        sku for sku in _trigram_candidates(suggest_index['sku_trigrams'], query)
+        if query in sku
+    }
+    matching_skus_by_name = {
+        sku for sku in _trigram_candidates(suggest_index['name_trigrams'], query)
+        if query in names_upper[sku]
+    }
+
+    matching_skus = sorted(matching_skus_by_id | matching_skus_by_name)[:10]
+
+    display_suggestions = []
+    for sku in matching_skus:
+        product_name = sku_product_map.get(sku, '')
+        if product_name:
+            display_suggestions.append(f"{sku} - {product_name}")
+        else:
+            display_suggestions.append(sku)
+
+    return tuple(matching_skus), tuple(display_suggestions)
+
 
 # Initialize data update service
 data_update_thread = None
@@ -59,11 +391,15 @@ if data_service_available:
     try:
         # Import locally within the conditional
         import data_update_service as data_service
-        logger.info("Initializing data update service")
-        data_update_thread = threading.Thread(
-            target=data_service.run_data_service, daemon=True)
-        data_update_thread.start()
-        logger.info("Data update service thread started")
+        if data_service.Config.SERVICE_MODE == 'process':
+            # Started once outside the app; each worker reloads the shared file when it changes
+            logger.info("Data update service runs as a separate process")
+        else:
+            logger.info("Initializing data update service")
+            data_update_thread = threading.Thread(
+                target=data_service.run_data_service, daemon=True)
+            data_update_thread.start()
+            logger.info("Data update service thread started")
     except Exception as e:
         logger.error(f"Failed to start data update service: {str(e)}")
         data_service_available = False
@@ -115,55 +451,66 @@ def sync_history():
         session.close()
 
 
+# Product keys that may hold each download column, in column order
+DOWNLOAD_COLUMN_MAP = {
+    "sku": "SKU",
+    "name": "Name",
+    "product_page_url": "Product Page URL",
+    "product_page": "Product Page URL",
+    "url": "Product Page URL",
+    "brand": "Brand",
+    "series": "Series"
+}
+
+
 @app.route("/download/<sku>")
 def download_compatibilities(sku):
     """
     Generate an .xlsx file (single worksheet) listing all compatible products for `sku`.
     Columns: SKU | Name | Product Page URL | Brand | Series
     """
-    result = compatibility.find_compatible_products(sku)
+    # Normalize once here, like /search, so the lookup cache key is canonical
+    sku = sku.strip().upper()
+    result = find_compatible_products(sku)
     if result.get("product") is None:
         return abort(404, "SKU not found")
 
-    # Collect all compatible products across categories into one list
-    all_products = []
-    for cat in result.get("compatibles", []):
-        for p in cat.get("products", []):
-            all_products.append(p)
-
-    if not all_products:
+    products = [p for cat in result.get("compatibles", []) for p in cat.get("products", [])]
+    if not products:
         return abort(404, "No compatible products found")
 
-    df = pd.DataFrame(all_products)
-
-    # Map possible column names
-    column_map = {
-        "sku": "SKU",
-        "name": "Name",
-        "product_page_url": "Product Page URL",
-        "product_page": "Product Page URL",
-        "url": "Product Page URL",
-        "brand": "Brand",
-        "series": "Series"
-    }
-
     # Keep only columns that exist
-    available = {k: v for k, v in column_map.items() if k in df.columns}
+    present = set().union(*products)
+    available = {k: v for k, v in DOWNLOAD_COLUMN_MAP.items() if k in present}
     if not available:
         logger.warning(
-            "None of the expected columns found in dataframe columns=%s",
-            list(df.columns))
+            "None of the expected columns found in product keys=%s",
+            sorted(present))
         return abort(500, "Unexpected data format")
 
-    df = df[list(available.keys())].rename(columns=available)
-
-    # Remove duplicates
-    df = df.drop_duplicates()
-
-    # Build Excel workbook
+    # Project and remove duplicates in one pass over the products, so no
+    # DataFrame of every occurrence is built; missing values and NaN both
+    # become None, which drop_duplicates also treated as equal
+    seen = set()
+    rows = []
+    for p in products:
+        row = tuple(None if v is None or v != v else v for v in (p.get(k) for k in available))
+        if row not in seen:
+            seen.add(row)
+            rows.append(row)
+
+    # Build Excel workbook. constant_memory flushes each row as it is written,
+    # which requires row-ordered writes, so rows go through write_row directly
+    # instead of to_excel (which writes column by column)
     output = io.BytesIO()
-    with pd.ExcelWriter(output, engine="xlsxwriter") as xl:
-        df.to_excel(xl, sheet_name="Compatibilities", index=False)
+    with xlsxwriter.Workbook(output, {"constant_memory": True}) as workbook:
+        worksheet = workbook.add_worksheet("Compatibilities")
+        # Same header style pandas applies
+        header_format = workbook.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+        worksheet.write_row(0, 0, list(available.values()), header_format)
+        # None is written as an empty cell
+        for row_num, row in enumerate(rows, start=1):
+            worksheet.write_row(row_num, 0, row)
 
     output.seek(0)
     filename = f"compatibilities_{sku}.xlsx"
@@ -185,98 +532,62 @@ def suggest_skus():
 
         if not query or len(query) < 3:
             # Return empty results if query is too short
-            return jsonify({'suggestions': [], 'displaySuggestions': []})
+            return _conditional_response(jsonify({'suggestions': [], 'displaySuggestions': []}), 30)
 
         # Try to use database first, fall back to Excel if needed
-        from data_loader import check_database_ready
-        from models import get_session, Product
+        if data_loader.check_database_ready():
+            # models is optional, so it is only imported once the database is known to be usable
+            from models import get_session
+            from sqlalchemy import text
 
-        if check_database_ready():
             # Use database with optimized query
             session = get_session()
             try:
-                # Optimize: Search SKU first (exact prefix match is fastest), then name
-                # Use UPPER() for case-insensitive comparison which is faster with index
-                from sqlalchemy import func, or_
-
-                # Prioritize SKU matches (starts with query)
-                sku_matches = session.query(Product.sku, Product.product_name).filter(
-                    func.upper(Product.sku).like(f'{query}%')
-                ).limit(10).all()
-
-                # If we have enough SKU matches, return those
-                if len(sku_matches) >= 5:
-                    matching_skus = []
-                    display_suggestions = []
-                    for sku, product_name in sku_matches:
-                        matching_skus.append(sku)
-                        if product_name:
-                            display_suggestions.append(f"{sku} - {product_name}")
-                        else:
-                            display_suggestions.append(sku)
-
-                    return jsonify({
-                        'suggestions': matching_skus,
-                        'displaySuggestions': display_suggestions
-                    })
-
-                # Otherwise, also search in product names
-                all_matches = session.query(Product.sku, Product.product_name).filter(
-                    or_(
-                        func.upper(Product.sku).like(f'%{query}%'),
-                        func.upper(Product.product_name).like(f'%{query}%')
-                    )
-                ).limit(10).all()
+                # Prioritize SKU matches (starts with query), which use the text_pattern_ops
+                # index on UPPER(sku)
+                matches = session.execute(text("""
+                    SELECT sku, product_name
+                    FROM products
+                    WHERE UPPER(sku) LIKE :prefix
+                    LIMIT 10
+                """), {"prefix": f'{query}%'}).all()
+
+                # Only search in product names when there are not enough SKU matches;
+                # ILIKE on the bare columns uses the trigram indexes
+                if len(matches) < 5:
+                    matches = session.execute(text("""
+                        SELECT sku, product_name
+                        FROM products
+                        WHERE sku ILIKE :substring OR product_name ILIKE :substring
+                        LIMIT 10
+                    """), {"substring": f'%{query}%'}).all()
 
                 matching_skus = []
                 display_suggestions = []
-                for sku, product_name in all_matches:
+                for sku, product_name in matches:
                     matching_skus.append(sku)
                     if product_name:
                         display_suggestions.append(f"{sku} - {product_name}")
                     else:
                         display_suggestions.append(sku)
 
-                return jsonify({
+                return _conditional_response(jsonify({
                     'suggestions': matching_skus,
                     'displaySuggestions': display_suggestions
-                })
+                }), 30)
             finally:
                 session.close()
         else:
             # Fallback to Excel data
-            data = compatibility.load_data()
-            sku_product_map = {}
-
-            for sheet_name, df in data.items():
-                if 'Unique ID' in df.columns:
-                    product_name_col = 'Product Name' if 'Product Name' in df.columns else None
-                    for _, row in df.iterrows():
-                        sku = str(row['Unique ID'])
-                        product_name = str(row[product_name_col]) if product_name_col else ''
-                        sku_product_map[sku] = product_name
-
-            matching_skus_by_id = [sku for sku in sku_product_map.keys() if query in sku]
-            matching_skus_by_name = [sku for sku, name in sku_product_map.items() if name and query in name.upper()]
-
-            matching_skus = list(dict.fromkeys(matching_skus_by_id + matching_skus_by_name))
-            matching_skus.sort()
-            matching_skus = matching_skus[:10]
-
-            display_suggestions = []
-            for sku in matching_skus:
-                product_name = sku_product_map.get(sku, '')
-                if product_name:
-                    display_suggestions.append(f"{sku} - {product_name}")
-                else:
-                    display_suggestions.append(sku)
+            suggest_index = get_suggest_index(compatibility.load_data())
+            matching_skus, display_suggestions = _excel_suggestions(query, suggest_index['version'])
 
             logger.debug(f"Found {len(matching_skus)} suggestions from Excel for query '{query}'")
 
-            return jsonify({
-                'suggestions': matching_skus,
-                'displaySuggestions': display_suggestions
-            })
+            return _conditional_response(jsonify({
+                'suggestions': list(matching_skus),
+                'displaySuggestions': list(display_suggestions)
+            }), 30)
 
     except Exception as e:
         logger.error(f"Error in suggest_skus: {str(e)}")
@@ -287,19 +598,120 @@ def suggest_skus():
         })
 
 
+def _database_search_results(sku):
+    """Pre-computed /search results for a stripped, upper-case SKU, or None to fall back to Excel"""
+    # --- DATABASE-FIRST LOOKUP IMPROVEMENT ---
+    results = None
+    # First check if the database is available and has data
+    if data_loader.check_database_ready():
+        # Try to load product details from the database
+        db_product = data_loader.load_product_from_database(sku)
+        if db_product:
+            # Load pre-computed compatibilities from the database
+            db_compatibles = data_loader.load_compatible_products_from_database(sku)
+
+            # Only use database results if we actually found compatibility data
+            if db_compatibles:
+                formatted_compatibles = []
+                for cat, prods in db_compatibles.items():
+                    formatted_compatibles.append({
+                        "category": cat,
+                        "products": prods
+                    })
+
+                results = {
+                    "product": {
+                        "sku": sku,
+                        "name": db_product.get("Product Name"),
+                        "category": db_product.get("Category"),
+                        "brand": db_product.get("Brand"),
+                        "series": db_product.get("Series"),
+                        "family": db_product.get("Family"),
+                        "image_url": db_product.get("Image URL"),
+                        "product_page_url": db_product.get("Product Page URL"),
+                        "nominal_dimensions": db_product.get("Nominal Dimensions"),
+                        "installation": db_product.get("Installation")
+                    },
+                    "compatibles": formatted_compatibles,
+                    "incompatibility_reasons": {} # Database format handles this via result filtering
+                }
+
+    return results
+
+
+def _build_search_response(sku, results):
+    """Build the /search response payload for a stripped, upper-case SKU from its results"""
+    # ---------------------------------------------------------------
+    # Build the incompatibility_reasons object for the front‑end
+    # First, get any incompatibility reasons from the results directly
+    # Copied so the cached results are left untouched
+    incompatibility_reasons = dict(results.get("incompatibility_reasons", {}))
+
+    # Then, add any incompatibility reasons from compatibles array (for backward compatibility)
+    for cat in results.get("compatibles", []):
+        if cat.get("reason") and not cat.get("products"):
+            incompatibility_reasons[cat["category"]] = cat.get("reason", "")
+    # ---------------------------------------------------------------
+
+
+    if results and results['product']:
+        # Log the product details for debugging
+        product_name = results['product'].get('name', 'Unknown')
+        product_category = results['product'].get('category',
+                                                  'Unknown Category')
+        logger.debug(
+            f"Returning product: {product_name} from category: {product_category} for SKU: {sku}"
+        )
+
+        # Create a clean response object without any NaN values
+        clean_response = {
+            'success': True,
+            'sku': sku,
+            'product': results['product'],
+            'compatibles': results['compatibles'],
+            'incompatibility_reasons': incompatibility_reasons      # ← add this
+        }
+        return clean_response
+    else:
+        return {
+            'success': False,
+            'message': f'No product found for SKU {sku}'
+        }
+
+
+@lru_cache(maxsize=256)
+def _excel_search_response_body(sku, data_version):
+    """Memoize the serialized Excel-fallback /search body per SKU and data version"""
+    # Exceptions propagate uncached, so error responses are never reused
+    logger.info(f"Falling back to live Excel-based compatibility for SKU: {sku}")
+    return app.json.response(_build_search_response(sku, find_compatible_products(sku))).get_data()
+
+
+def _conditional_response(response, max_age, etag=None):
+    """Add ETag and Cache-Control headers, answering a matching If-None-Match with a 304"""
+    if etag is None:
+        etag = hashlib.blake2b(response.get_data(), digest_size=8).hexdigest()
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
+
+
+def _cached_json_response(cache_key, data, max_age=60):
+    """Encode data once, cache the body with its ETag, and answer conditionally"""
+    body = app.json.response(data).get_data()
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    cache_compatibles(cache_key, (body, etag))
+    return _conditional_response(app.response_class(body, mimetype='application/json'), max_age, etag)
+
+
 @app.route('/search', methods=['POST'])
 def search():
     """Handle SKU search request using a Database-First approach"""
     try:
-        # Check if the request is JSON or form data
-        if request.is_json:
-            data = request.json
-            sku = data.get('sku', '') if data else ''
-        else:
-            sku = request.form.get('sku', '')
-
-        # Normalize the SKU
-        sku = sku.strip().upper() if sku else ''
+        # JSON body when present, form data otherwise (get_json returns None for non-JSON)
+        payload = request.get_json(silent=True) or request.form
+        sku = (payload.get('sku') or '').strip().upper()
 
         if not sku:
             return jsonify({
@@ -310,156 +722,18 @@ def search():
         # Log the search request
         logger.debug(f"Searching for SKU: {sku}")
 
-        # --- DATABASE-FIRST LOOKUP IMPROVEMENT ---
-        results = None
-        # First check if the database is available and has data
-        if data_loader.check_database_ready():
-            # Try to load product details from the database
-            db_product = data_loader.load_product_from_database(sku)
-            if db_product:
-                # Load pre-computed compatibilities from the database
-                db_compatibles = data_loader.load_compatible_products_from_database(sku)
-
-                # Only use database results if we actually found compatibility data
-                if db_compatibles:
-                    formatted_compatibles = []
-                    for cat, prods in db_compatibles.items():
-                        formatted_compatibles.append({
-                            "category": cat,
-                            "products": prods
-                        })
-
-                    results = {
-                        "product": {
-                            "sku": sku,
-                            "name": db_product.get("Product Name"),
-                            "category": db_product.get("Category"),
-                            "brand": db_product.get("Brand"),
-                            "series": db_product.get("Series"),
-                            "family": db_product.get("Family"),
-                            "image_url": db_product.get("Image URL"),
-                            "product_page_url": db_product.get("Product Page URL"),
-                            "nominal_dimensions": db_product.get("Nominal Dimensions"),
-                            "installation": db_product.get("Installation")
-                        },
-                        "compatibles": formatted_compatibles,
-                        "incompatibility_reasons": {} # Database format handles this via result filtering
-                    }
-
-        # Fallback to the original live computation logic if database lookup failed or found nothing
-        if not results:
-            logger.info(f"Falling back to live Excel-based compatibility for SKU: {sku}")
-            results = compatibility.find_compatible_products(sku)
-
-        # ---------------------------------------------------------------
-        # Build the incompatibility_reasons object for the front‑end
-        # First, get any incompatibility reasons from the results directly
-        incompatibility_reasons = results.get("incompatibility_reasons", {})
-
-        # Then, add any incompatibility reasons from compatibles array (for backward compatibility)
-        for cat in results.get("compatibles", []):
-            if cat.get("reason") and not cat.get("products"):
-                incompatibility_reasons[cat["category"]] = cat.get("reason", "")
-        # ---------------------------------------------------------------
-
-
-        if results and results['product']:
-            # Log the product details for debugging
-            product_name = results['product'].get('name', 'Unknown')
-            product_category = results['product'].get('category',
-                                                      'Unknown Category')
-            logger.debug(
-                f"Returning product: {product_name} from category: {product_category} for SKU: {sku}"
-            )
-
-            # Create a clean response object without any NaN values
-            clean_response = {
-                'success': True,
-                'sku': sku,
-                'product': results['product'],
-                'compatibles': results['compatibles'],
-                'incompatibility_reasons': incompatibility_reasons      # ← add this
-            }
-
-            # Import pandas and json at the top of the function for better clarity
-            import pandas as pd
-            import json
-
-            # Deep clean function to replace NaN, None and other problematic values
-            def deep_clean(obj):
-                # Handle arrays and pandas objects safely
-                if isinstance(obj, (list, tuple)):
-                    return [deep_clean(item) for item in obj]
-                elif isinstance(obj, dict):
-                    return {k: deep_clean(v) for k, v in obj.items()}
-                # Check for None first to avoid unnecessary pd.isna calls
-                elif obj is None:
-                    return None
-                # Use safer check for NaN values
-                elif isinstance(obj,
-                                (float, int)) and (pd.isna(obj) if hasattr(
-                                    pd, 'isna') else False):
-                    return None
-                # Safely handle pandas objects
-                elif hasattr(pd, 'isna') and hasattr(pd, 'api') and hasattr(
-                        pd.api, 'types'):
-                    # Handle pandas Series or DataFrame
-                    if pd.api.types.is_scalar(obj) and pd.isna(obj):
-                        return None
-                    else:
-                        return obj
-                else:
-                    return obj
-
-            # Apply deep cleaning to the entire response
-            clean_response = deep_clean(clean_response)
-
-            # Serialize to JSON with error handling
-            try:
-                # Create a custom JSON encoder that safely handles all types
-                def custom_json_default(obj):
-                    if pd.isna(obj) if hasattr(pd, 'isna') else False:
-                        return None
-                    elif hasattr(obj, 'isoformat'):  # Handle date/time objects
-                        return obj.isoformat()
-                    elif isinstance(obj, (complex, bytes, bytearray)):
-                        return str(obj)
-                    else:
-                        return str(obj)  # Last resort, convert to string
-
-                # Convert to JSON string and back to ensure all values are JSON-compatible
-                clean_json_str = json.dumps(clean_response,
-                                            default=custom_json_default)
-                return jsonify(json.loads(clean_json_str))
-            except Exception as e:
-                logger.error(f"JSON serialization error: {str(e)}")
-                # Fallback to a simpler response with string conversion
-                safe_response = {
-                    'success':
-                    True,
-                    'sku':
-                    str(sku),
-                    'product': {
-                        k: str(v) if not isinstance(v, (dict, list)) else v
-                        for k, v in results['product'].items()
-                    },
-                    'compatibles': [{
-                        'category':
-                        c.get('category', ''),
-                        'products': [{
-                            k:
-                            str(v) if not isinstance(v, (dict, list)) else v
-                            for k, v in p.items()
-                        } for p in c.get('products', [])]
-                    } for c in results['compatibles']],
-                    'incompatibility_reasons': incompatibility_reasons  # ← add this'
-                }
-                return jsonify(safe_response)
+        # Database results are read on every request, since syncs and recomputes
+        # run in other processes. Only the Excel fallback, which depends on the
+        # loaded workbook alone, is memoized per data version
+        results = _database_search_results(sku)
+        if results:
+            body = app.json.response(_build_search_response(sku, results)).get_data()
         else:
-            return jsonify({
-                'success': False,
-                'message': f'No product found for SKU {sku}'
-            })
+            body = _excel_search_response_body(sku, get_data_version())
+
+        # POST responses are never answered with a 304 or reused by shared caches,
+        # so no ETag or Cache-Control headers are sent
+        return app.response_class(body, mimetype='application/json')
 
     except Exception as e:
         logger.error(f"Error processing search: {str(e)}")
@@ -474,7 +748,15 @@ def search():
 # REST API ENDPOINTS FOR EXTERNAL ACCESS
 # ============================================================================
 
+def _project_products(products, fields):
+    """Keep only the requested keys of each product dict; no fields keeps them all"""
+    if not fields:
+        return products
+    return [{k: p[k] for k in fields if k in p} for p in products]
+
+
 @app.route('/api/compatible/<sku>', methods=['GET'])
+@compressed()
 def api_get_compatible(sku):
     """
     REST API endpoint to get compatible products for a given SKU.
@@ -490,12 +772,14 @@ def api_get_compatible(sku):
         - category: Filter by category (optional)
         - brand: Filter by brand name (optional, case-insensitive)
         - limit: Limit results per category (optional, default: 100)
+        - fields: Comma-separated product keys to return (optional, default: all)
 
     Example: GET /api/compatible/410000-501-001-000?parent_sku=410000&unique_id=410000-501-001
     Example: GET /api/compatible/FB03060M
     Example: GET /api/compatible/FB03060M?category=Doors&limit=20
     Example: GET /api/compatible/FB03060M?brand=MAAX
     Example: GET /api/compatible/FB03060M?brand=Neptune&category=Walls
+    Example: GET /api/compatible/FB03060M?fields=sku,name,image_url,product_page_url
     """
     try:
         child_sku = sku.strip().upper()
@@ -504,17 +788,27 @@ def api_get_compatible(sku):
         category_filter = request.args.get('category', '').strip()
         brand_filter = request.args.get('brand', '').strip()
         limit = request.args.get('limit', type=int, default=100)
+        # Optional comma-separated list of product keys to return, e.g. for grid views.
+        # Unknown keys are ignored, so naming none that exist returns every field
+        fields = tuple(f.strip() for f in request.args.get('fields', '').split(',')
+                       if f.strip() in data_loader.COMPATIBLE_PRODUCT_FIELDS)
 
         logger.info(f"API request for compatible products: child_sku={child_sku}, parent_sku={parent_sku if parent_sku else 'N/A'}, unique_id={unique_id if unique_id else 'N/A'}, brand={brand_filter if brand_filter else 'N/A'}")
 
-        # Create cache key from request parameters
-        cache_key = f"{child_sku}|{parent_sku}|{unique_id}|{category_filter}|{brand_filter}|{limit}"
-
-        # Check cache first
-        cached_response = get_cached_compatibles(cache_key)
-        if cached_response:
+        # Create cache key from request parameters; the data version keeps
+        # Excel fallback responses from outliving the data they were built from,
+        # and the database generation does the same for database writes made by
+        # other processes (webhook worker, syncs, recomputes)
+        cache_key = (f"{child_sku}|{parent_sku}|{unique_id}|{category_filter}|{brand_filter}|{limit}|{','.join(fields)}"
+                     f"|{get_data_version()}|{data_loader.get_database_generation()}")
+
+        # Check cache first; hits skip the lookup and the JSON encode entirely,
+        # and a matching If-None-Match skips sending the body as well
+        cached = get_cached_compatibles(cache_key)
+        if cached is not None:
             logger.info(f"Cache hit for {cache_key}")
-            return jsonify(cached_response)
+            body, etag = cached
+            return _conditional_response(app.response_class(body, mimetype='application/json'), 60, etag)
 
         # Check if database is available
         if not data_loader.check_database_ready():
@@ -525,9 +819,17 @@ def api_get_compatible(sku):
                 'queried_child_sku': child_sku
             }), 503
 
+        # Without a brand filter, PostgreSQL truncates and counts each category, so
+        # rows past the limit are never transferred; db_totals then holds the full
+        # per-category counts
+        page_limit = limit if limit > 0 and not brand_filter else None
+        db_result = None
+
         # Use multi-SKU lookup if parent_sku or unique_id provided
         if parent_sku or unique_id:
-            match_result = data_loader.find_product_by_multi_sku(child_sku, parent_sku, unique_id)
+            match_result = None
+            if _may_exist_in_database(child_sku, parent_sku, unique_id):
+                match_result = data_loader.find_product_by_multi_sku(child_sku, parent_sku, unique_id)
             if not match_result:
                 return jsonify({
                     'success': False,
@@ -538,28 +840,29 @@ def api_get_compatible(sku):
                     'message': 'No product found matching any of the provided SKUs (child_sku, parent_sku, unique_id)'
                 }), 404
 
-            product_data = match_result['product_data']
+            product_summary = match_result['product_summary']
             matched_sku = match_result['matched_sku']
             match_type = match_result['match_type']
             lookup_sku = matched_sku
         else:
-            # Fallback to single SKU lookup for backward compatibility
-            product_data = data_loader.load_product_from_database(child_sku)
+            # Fallback to single SKU lookup for backward compatibility. A variant SKU
+            # (e.g., FF03232MD.010) falls back to its parent (FF03232MD), and the product
+            # and its compatibilities come back from the same query
+            variant_parent = child_sku.rsplit('.', 1)[0] if '.' in child_sku else None
+            if _may_exist_in_database(child_sku, variant_parent):
+                db_result = data_loader.load_product_with_compatibles_from_database(child_sku, variant_parent, page_limit)
+            product_summary = db_result[0] if db_result else None
             matched_sku = None
             match_type = None
             lookup_sku = child_sku
 
-            # If not found, try stripping variant suffix (e.g., FF03232MD.010 -> FF03232MD)
-            if not product_data and '.' in child_sku:
-                variant_parent = child_sku.rsplit('.', 1)[0]
-                logger.info(f"Product {child_sku} not found, trying variant parent SKU: {variant_parent}")
-                product_data = data_loader.load_product_from_database(variant_parent)
-                if product_data:
-                    lookup_sku = variant_parent
-                    matched_sku = variant_parent
-                    match_type = 'variant_parent'
-
-            if not product_data:
+            if product_summary and product_summary['sku'] != child_sku:
+                logger.info(f"Product {child_sku} not found, using variant parent SKU: {variant_parent}")
+                lookup_sku = variant_parent
+                matched_sku = variant_parent
+                match_type = 'variant_parent'
+
+            if not product_summary:
                 return jsonify({
                     'success': False,
                     'error': 'Product not found in database',
@@ -567,8 +870,17 @@ def api_get_compatible(sku):
                     'message': 'Product not found. If this is a variant SKU (e.g., SKU.010), the parent SKU may not exist in the database.'
                 }), 404
 
-        # Load compatibilities from database using the matched SKU
-        db_compatibles = data_loader.load_compatible_products_from_database(lookup_sku)
+        # Load compatibilities from database using the matched SKU, unless the
+        # single SKU lookup already returned them with the product
+        if db_result is not None:
+            db_compatibles = db_result[1]
+            db_totals = db_result[2] if not brand_filter else None
+        elif page_limit:
+            db_page = data_loader.load_compatible_products_page_from_database(lookup_sku, page_limit)
+            db_compatibles, db_totals = db_page if db_page else (None, None)
+        else:
+            db_compatibles = data_loader.load_compatible_products_from_database(lookup_sku)
+            db_totals = None
 
         # Check if database results are incomplete (None or only reverse compatibility)
         use_excel_fallback = False
@@ -577,7 +889,10 @@ def api_get_compatible(sku):
             logger.info(f"Product {lookup_sku} has no compatibilities in database, using Excel fallback")
         else:
             # Count total products across all categories
-            total_products = sum(len(products) for products in db_compatibles.values())
+            if db_totals is not None:
+                total_products = sum(db_totals.values())
+            else:
+                total_products = sum(len(products) for products in db_compatibles.values())
             if total_products <= 1:
                 # Check if the single product is just a reverse compatibility entry (pointing to itself with score 0)
                 for category, products in db_compatibles.items():
@@ -592,24 +907,12 @@ def api_get_compatible(sku):
         if use_excel_fallback:
             # Fall back to Excel-based compatibility logic (same as web interface)
             logger.info(f"Falling back to Excel data for SKU: {lookup_sku}")
-            excel_results = compatibility.find_compatible_products(lookup_sku)
+            excel_results = find_compatible_products(lookup_sku)
 
             if excel_results and excel_results.get('product'):
-                # Helper function to clean NaN values for JSON serialization
-                import pandas as pd
-                import math
-
-                def clean_value(value):
-                    """Convert NaN, None, and other invalid JSON values to None"""
-                    if value is None:
-                        return None
-                    if isinstance(value, float) and (pd.isna(value) or math.isnan(value)):
-                        return None
-                    if pd.isna(value):
-                        return None
-                    return value
-
                 # Convert Excel results to API format
+                # find_compatible_products already returns None for missing values,
+                # so fields are copied as-is and the JSON encoder does the walk
                 # The web interface returns {product: {...}, compatibles: [...], incompatibility_reasons: {...}}
                 excel_compatibles = excel_results.get('compatibles', [])
 
@@ -632,32 +935,24 @@ def api_get_compatible(sku):
                     limited_products = products_list[:limit] if limit else products_list
                     compatibles.append({
                         'category': category,
-                        'products': [{
-                            'sku': clean_value(p.get('sku')),
-                            'name': clean_value(p.get('name')),
-                            'brand': clean_value(p.get('brand')),
+                        'products': _project_products([{
+                            'sku': p.get('sku'),
+                            'name': p.get('name'),
+                            'brand': p.get('brand'),
                             'category': category,
-                            'series': clean_value(p.get('series')),
-                            'image_url': clean_value(p.get('image_url')),
-                            'product_page_url': clean_value(p.get('product_page_url')),
+                            'series': p.get('series'),
+                            'image_url': p.get('image_url'),
+                            'product_page_url': p.get('product_page_url'),
                             'compatibility_score': p.get('compatibility_score', 500)
-                        } for p in limited_products]
+                        } for p in limited_products], fields)
                     })
 
                 base_product = excel_results['product']
+                # Same product fields, in the same order, as the database path's summary
                 response = {
                     'success': True,
                     'queried_child_sku': child_sku,
-                    'product': {
-                        'sku': clean_value(base_product.get('sku')),
-                        'name': clean_value(base_product.get('name')),
-                        'brand': clean_value(base_product.get('brand')),
-                        'category': clean_value(base_product.get('category')),
-                        'series': clean_value(base_product.get('series')),
-                        'family': clean_value(base_product.get('family')),
-                        'image_url': clean_value(base_product.get('image_url')),
-                        'product_page_url': clean_value(base_product.get('product_page_url')),
-                    },
+                    'product': {field: base_product.get(field) for field in data_loader.PRODUCT_SUMMARY_FIELDS},
                     'compatibles': compatibles,
                     'incompatibility_reasons': excel_results.get('incompatibility_reasons', {}),
                     'total_categories': len(compatibles),
@@ -672,25 +967,15 @@ def api_get_compatible(sku):
                 if unique_id:
                     response['queried_unique_id'] = unique_id
 
-                # Cache the response
-                cache_compatibles(cache_key, response)
-                return jsonify(response)
+                # Cache the encoded response
+                return _cached_json_response(cache_key, response)
             else:
                 # Excel fallback also found nothing
                 logger.warning(f"No compatibility data found in Excel for SKU: {lookup_sku}")
                 response = {
                     'success': True,
                     'queried_child_sku': child_sku,
-                    'product': {
-                        'sku': product_data.get('Unique ID'),
-                        'name': product_data.get('Product Name'),
-                        'brand': product_data.get('Brand'),
-                        'category': product_data.get('Category'),
-                        'series': product_data.get('Series'),
-                        'family': product_data.get('Family'),
-                        'image_url': product_data.get('Image URL'),
-                        'product_page_url': product_data.get('Product Page URL'),
-                    },
+                    'product': product_summary,
                     'compatibles': [],
                     'incompatibility_reasons': {},
                     'total_categories': 0,
@@ -704,7 +989,7 @@ def api_get_compatible(sku):
                     response['queried_parent_sku'] = parent_sku
                 if unique_id:
                     response['queried_unique_id'] = unique_id
-                return jsonify(response)
+                return _conditional_response(jsonify(response), 60)
 
         # Build compatibles list
         compatibles = []
@@ -720,32 +1005,24 @@ def api_get_compatible(sku):
             if not products:
                 continue
 
-            if len(products) > limit:
+            category_total = db_totals[category] if db_totals is not None else len(products)
+            if category_total > limit:
                 compatibles.append({
                     'category': category,
-                    'products': products[:limit],
+                    'products': _project_products(products[:limit], fields),
                     'truncated': True,
-                    'total_count': len(products)
+                    'total_count': category_total
                 })
             else:
                 compatibles.append({
                     'category': category,
-                    'products': products
+                    'products': _project_products(products, fields)
                 })
 
         response = {
             'success': True,
             'queried_child_sku': child_sku,
-            'product': {
-                'sku': product_data.get('Unique ID'),
-                'name': product_data.get('Product Name'),
-                'brand': product_data.get('Brand'),
-                'category': product_data.get('Category'),
-                'series': product_data.get('Series'),
-                'family': product_data.get('Family'),
-                'image_url': product_data.get('Image URL'),
-                'product_page_url': product_data.get('Product Page URL'),
-            },
+            'product': product_summary,
             'compatibles': compatibles,
             'incompatibility_reasons': {},
             'total_categories': len(compatibles),
@@ -763,11 +1040,9 @@ def api_get_compatible(sku):
         if unique_id:
             response['queried_unique_id'] = unique_id
 
-        # Cache the response before returning
-        cache_compatibles(cache_key, response)
+        # Cache the encoded response before returning
         logger.info(f"Cached response for {cache_key}")
-
-        return jsonify(response)
+        return _cached_json_response(cache_key, response)
 
     except Exception as e:
         logger.error(f"API error for compatible/{child_sku}: {str(e)}")
@@ -793,51 +1068,35 @@ def api_get_product(sku):
 
         logger.info(f"API request for product details: SKU={sku}")
 
-        if data_loader.check_database_ready():
+        if data_loader.check_database_ready() and _may_exist_in_database(sku):
             logger.info(f"Attempting to load product from database: {sku}")
             product_data = data_loader.load_product_from_database(sku)
 
             if product_data:
-                import pandas as pd
-                product_clean = {}
-                for k, v in product_data.items():
-                    if pd.isna(v):
-                        product_clean[k] = None
-                    else:
-                        product_clean[k] = v
+                product_clean = _nan_to_none_record(product_data)
 
-                return jsonify({
+                return _conditional_response(jsonify({
                     'success': True,
                     'sku': sku,
                     'category': product_clean.get('Category'),
                     'product': product_clean,
                     'data_source': 'database'
-                })
+                }), 60)
 
         logger.info(f"Falling back to Excel for product: {sku}")
-        data = compatibility.load_data()
-
-        for sheet_name, df in data.items():
-            if 'Unique ID' in df.columns:
-                matching_rows = df[df['Unique ID'].astype(str).str.upper() == sku]
-                if not matching_rows.empty:
-                    product_data = matching_rows.iloc[0].to_dict()
-
-                    import pandas as pd
-                    product_clean = {}
-                    for k, v in product_data.items():
-                        if pd.isna(v):
-                            product_clean[k] = None
-                        else:
-                            product_clean[k] = v
-
-                    return jsonify({
-                        'success': True,
-                        'sku': sku,
-                        'category': sheet_name,
-                        'product': product_clean,
-                        'data_source': 'excel'
-                    })
+        product_tables = get_product_tables(compatibility.load_data())
+
+        # One hash lookup instead of upper-casing and scanning every sheet
+        location = product_tables['sku_rows'].get(sku)
+        if location:
+            sheet_name, position = location
+            return _conditional_response(jsonify({
+                'success': True,
+                'sku': sku,
+                'category': sheet_name,
+                'product': product_tables['clean'][sheet_name].iloc[position].to_dict(),
+                'data_source': 'excel'
+            }), 60)
 
         return jsonify({
             'success': False,
@@ -856,6 +1115,7 @@ def api_get_product(sku):
 
 
 @app.route('/api/products', methods=['GET'])
+@compressed()
 def api_list_products():
     """
     REST API endpoint to list all products.
@@ -882,25 +1142,13 @@ def api_list_products():
             db_products, total_count = data_loader.get_all_products_from_database(
                 category=category_filter if category_filter else None,
                 limit=limit,
-                offset=offset
+                offset=offset,
+                brand=brand_filter if brand_filter else None
             )
 
-            if brand_filter:
-                db_products = [p for p in db_products if brand_filter in str(p.get('Brand', '')).lower()]
-                total_count = len(db_products)
-
-            import pandas as pd
-            clean_products = []
-            for product in db_products:
-                product_clean = {}
-                for k, v in product.items():
-                    if pd.isna(v):
-                        product_clean[k] = None
-                    else:
-                        product_clean[k] = v
-                clean_products.append(product_clean)
+            clean_products = [_nan_to_none_record(product) for product in db_products]
 
-            return jsonify({
+            return _conditional_response(jsonify({
                 'success': True,
                 'products': clean_products,
                 'total_count': total_count,
@@ -908,39 +1156,47 @@ def api_list_products():
                 'offset': offset,
                 'returned_count': len(clean_products),
                 'data_source': 'database'
-            })
+            }), 60)
 
         logger.info("Falling back to Excel for products list")
-        data = compatibility.load_data()
-        all_products = []
+        product_tables = get_product_tables(compatibility.load_data())
+        matching_frames = []
 
-        for sheet_name, df in data.items():
+        for sheet_name, df in product_tables['clean'].items():
             if category_filter and sheet_name.lower() != category_filter.lower():
                 continue
 
-            if 'Unique ID' in df.columns:
-                for _, row in df.iterrows():
-                    product_dict = row.to_dict()
-
-                    if brand_filter:
-                        product_brand = str(product_dict.get('Brand', '')).lower()
-                        if brand_filter not in product_brand:
-                            continue
-
-                    import pandas as pd
-                    product_clean = {'category': sheet_name}
-                    for k, v in product_dict.items():
-                        if pd.isna(v):
-                            product_clean[k] = None
-                        else:
-                            product_clean[k] = v
-
-                    all_products.append(product_clean)
-
-        total_count = len(all_products)
-        paginated_products = all_products[offset:offset + limit]
+            # Matching row positions; the frame itself is only sliced for the page
+            if brand_filter:
+                brands = product_tables['brands'].get(sheet_name)
+                if brands is None:
+                    continue
+                # Match each distinct brand once, then spread the result to rows by code
+                brand_matches = np.asarray(brands.categories.str.contains(brand_filter, regex=False), dtype=bool)
+                positions = np.flatnonzero(brand_matches[brands.codes])
+            else:
+                positions = np.arange(len(df))
+
+            matching_frames.append((sheet_name, df, positions))
+
+        # Count every match but only build dicts for the requested page
+        total_count = sum(len(positions) for _, _, positions in matching_frames)
+        paginated_products = []
+        skip, remaining = offset, limit
+        for sheet_name, df, positions in matching_frames:
+            if remaining <= 0:
+                break
+            if skip >= len(positions):
+                skip -= len(positions)
+                continue
+            page = df.iloc[positions[skip:skip + remaining]]
+            skip = 0
+            remaining -= len(page)
+            paginated_products.extend(
+                {'category': sheet_name, **record} for record in page.to_dict(orient='records')
+            )
 
-        return jsonify({
+        return _conditional_response(jsonify({
             'success': True,
             'products': paginated_products,
             'total_count': total_count,
@@ -948,7 +1204,7 @@ def api_list_products():
             'offset': offset,
             'returned_count': len(paginated_products),
             'data_source': 'excel'
-        })
+        }), 60)
 
     except Exception as e:
         logger.error(f"API error for products list: {str(e)}")
@@ -971,21 +1227,11 @@ def api_list_categories():
     try:
         logger.info("API request for categories list")
 
-        data = compatibility.load_data()
-        categories = []
+        product_counts = get_product_counts(compatibility.load_data())
 
-        for sheet_name, df in data.items():
-            if 'Unique ID' in df.columns:
-                categories.append({
-                    'name': sheet_name,
-                    'product_count': len(df)
-                })
-
-        return jsonify({
-            'success': True,
-            'categories': categories,
-            'total_categories': len(categories)
-        })
+        return _conditional_response(
+            app.response_class(product_counts['categories_body'], mimetype='application/json'),
+            300, product_counts['categories_etag'])
 
     except Exception as e:
         logger.error(f"API error for categories list: {str(e)}")
@@ -996,6 +1242,12 @@ def api_list_categories():
         }), 500
 
 
+# Health status reused for a few seconds, so frequent monitoring probes don't
+# re-count database tables on every call
+_health_ttl_seconds = 5.0
+_health_cache = {'expires': 0.0, 'status': None}
+
+
 @app.route('/api/health', methods=['GET'])
 def api_health():
     """
@@ -1005,30 +1257,36 @@ def api_health():
 
     Example: GET /api/health
     """
+    global _health_cache
     try:
+        now = time.monotonic()
+        cached = _health_cache
+        if cached['status'] is not None and now < cached['expires']:
+            return jsonify(cached['status'])
+
         data_source_info = data_loader.get_data_source_info()
 
-        data = compatibility.load_data()
-        total_products = sum(len(df) for df in data.values())
+        product_counts = get_product_counts(compatibility.load_data())
 
         health_status = {
             'success': True,
             'status': 'healthy',
-            'total_products': total_products,
-            'categories': len(data),
+            'total_products': product_counts['total_products'],
+            'categories': product_counts['sheet_count'],
             'data_service_available': data_service_available,
             'data_source': data_source_info
         }
 
         if data_service_available:
             try:
-                import data_update_service as data_service
-                cached_data, update_time = data_service.get_product_data()
+                cached_data, update_time = data_update_service.get_product_data()
                 if update_time:
                     health_status['last_data_update'] = update_time.isoformat()
             except Exception:
                 pass
 
+        # Only healthy results are reused; failures are re-checked on the next probe
+        _health_cache = {'expires': now + _health_ttl_seconds, 'status': health_status}
         return jsonify(health_status)
 
     except Exception as e:
@@ -1215,7 +1473,6 @@ def salsify_webhook():
         # This avoids using background threads which get killed by Gunicorn --reload
         webhook_queue_path = os.path.join('data', 'webhook_queue.json')
         try:
-            import json
             queue_data = {
                 'sync_id': sync_id,
                 'product_feed_url': product_feed_url,
@@ -22,17 +22,18 @@ def load_excel_data():
     
     logger.info("Loading Excel data...")
     
-    data = {}
     sheets = ['Shower Bases', 'Bathtubs', 'Showers', 'Tub Showers', 'Shower Doors', 
               'Walls', 'Screens', 'Accessories']
     
-    for sheet in sheets:
-        try:
-            df = pd.read_excel(data_file, sheet_name=sheet)
-            data[sheet] = df
-            logger.info(f"  Loaded {len(df)} products from {sheet}")
-        except Exception as e:
-            logger.warning(f"  Could not load {sheet}: {e}")
+    # Open the workbook once and parse every available sheet in one call
+    with pd.ExcelFile(data_file) as xls:
+        for sheet in sheets:
+            if sheet not in xls.sheet_names:
+                logger.warning(f"  Could not load {sheet}: sheet not found")
+        data = pd.read_excel(xls, sheet_name=[s for s in sheets if s in xls.sheet_names])
+    
+    for sheet, df in data.items():
+        logger.info(f"  Loaded {len(df)} products from {sheet}")
     
     return data
 
@@ -1,5 +1,9 @@
 import os
+import shutil
+import tempfile
 import logging
+import threading
+import time
 import pandas as pd
 from typing import Dict, Optional, Tuple
 from datetime import datetime
@@ -18,9 +22,40 @@ except ImportError as e:
     db_available = False
 
 
+# Every API request asks whether the database is ready; the answer (a COUNT
+# query) is reused for a few seconds instead of being re-queried each time
+DB_READY_TTL_SECONDS = 5.0
+_db_ready_cache = (0.0, False)  # (time.monotonic() expiry, result)
+_db_ready_lock = threading.Lock()
+
+
 def check_database_ready() -> bool:
     """
-    Check if the database is available and has data.
+    Check if the database is available and has data, reusing the result for
+    DB_READY_TTL_SECONDS.
+    
+    Returns:
+        bool: True if database is ready to use, False otherwise
+    """
+    global _db_ready_cache
+    
+    expires, ready = _db_ready_cache
+    if time.monotonic() < expires:
+        return ready
+    
+    with _db_ready_lock:
+        # Another thread may have refreshed it while this one waited
+        expires, ready = _db_ready_cache
+        if time.monotonic() < expires:
+            return ready
+        ready = check_database_ready_uncached()
+        _db_ready_cache = (time.monotonic() + DB_READY_TTL_SECONDS, ready)
+        return ready
+
+
+def check_database_ready_uncached() -> bool:
+    """
+    Check if the database is available and has data, querying it every time.
     
     Returns:
         bool: True if database is ready to use, False otherwise
@@ -52,6 +87,112 @@ def check_database_ready() -> bool:
         return False
 
 
+# Every SKU in the products table, so lookups of unknown SKUs (old links,
+# crawlers) can be answered without a query; reloaded every few minutes, and
+# at most every few seconds when a SKU is missing from it, since products are
+# written by other processes
+KNOWN_SKUS_TTL_SECONDS = 300.0
+KNOWN_SKUS_MISS_RELOAD_SECONDS = 5.0
+_known_skus_cache = (float('-inf'), None)  # (time.monotonic() of the load, frozenset of SKUs)
+_known_skus_lock = threading.Lock()
+
+
+def get_known_skus(max_age: float = KNOWN_SKUS_TTL_SECONDS) -> Optional[frozenset]:
+    """
+    Get the set of SKUs in the database, reloading it once it is older than max_age.
+    
+    Args:
+        max_age (float): Seconds the loaded set may be reused for
+        
+    Returns:
+        frozenset or None: Upper-case SKUs, or None if they could not be loaded
+    """
+    global _known_skus_cache
+    
+    loaded, skus = _known_skus_cache
+    if time.monotonic() - loaded < max_age:
+        return skus
+    
+    with _known_skus_lock:
+        # Another thread may have reloaded it while this one waited
+        loaded, skus = _known_skus_cache
+        if time.monotonic() - loaded < max_age:
+            return skus
+        
+        try:
+            from sqlalchemy import text
+            from models import get_engine
+            
+            with get_engine().connect() as conn:
+                skus = frozenset(conn.execute(text("SELECT sku FROM products")).scalars())
+        except Exception as e:
+            logger.error(f"Error loading SKUs from database: {str(e)}")
+            skus = None
+        
+        _known_skus_cache = (time.monotonic(), skus)
+        return skus
+
+
+def clear_known_skus() -> None:
+    """Drop the cached SKU set so the next lookup reloads it (call after data updates)"""
+    global _known_skus_cache
+
+    with _known_skus_lock:
+        _known_skus_cache = (float('-inf'), None)
+
+
+# Summary of the latest writes to products and product_compatibility, so caches
+# can tell when another process changed the database; reused for a few seconds
+DB_GENERATION_TTL_SECONDS = 5.0
+_db_generation_cache = (float('-inf'), None)  # (time.monotonic() of the query, generation)
+_db_generation_lock = threading.Lock()
+
+
+def get_database_generation() -> Optional[str]:
+    """
+    Get a value that changes whenever products or pre-computed compatibilities
+    are written, by any process, reusing it for DB_GENERATION_TTL_SECONDS.
+    
+    Returns:
+        str or None: Generation, or None if the database is not available
+    """
+    global _db_generation_cache
+    
+    if not db_available or USE_DATABASE == 'false':
+        return None
+    
+    loaded, generation = _db_generation_cache
+    if time.monotonic() - loaded < DB_GENERATION_TTL_SECONDS:
+        return generation
+    
+    with _db_generation_lock:
+        # Another thread may have refreshed it while this one waited
+        loaded, generation = _db_generation_cache
+        if time.monotonic() - loaded < DB_GENERATION_TTL_SECONDS:
+            return generation
+        
+        try:
+            from sqlalchemy import text
+            from models import get_engine
+            
+            with get_engine().connect() as conn:
+                # Recomputes delete and re-insert rows, so the newest compatibility id
+                # moves with them; max(id) is answered from the primary key index
+                row = conn.execute(text("""
+                    SELECT
+                        (SELECT max(id) FROM product_compatibility),
+                        (SELECT count(*) FROM products),
+                        (SELECT max(updated_at) FROM products)
+                """)).one()
+            generation = "|".join(str(value) for value in row)
+        except Exception as e:
+            logger.warning(f"Could not read database generation: {str(e)}")
+            generation = None
+        
+        _db_generation_cache = (time.monotonic(), generation)
+        return generation
+
+
 def load_product_from_database(sku: str) -> Optional[Dict]:
     """
     Load a single product from the database.
@@ -96,6 +237,24 @@ def load_product_from_database(sku: str) -> Optional[Dict]:
         return None
 
 
+# Product fields returned by the compatibility API, in response order
+PRODUCT_SUMMARY_FIELDS = ('sku', 'name', 'brand', 'category', 'series', 'family', 'image_url', 'product_page_url')
+
+
+def _product_summary(product) -> Dict:
+    """Project a Product row onto the product fields the compatibility API returns"""
+    return {
+        'sku': product.sku,
+        'name': product.product_name,
+        'brand': product.brand,
+        'category': product.category,
+        'series': product.series,
+        'family': product.family,
+        'image_url': product.image_url,
+        'product_page_url': product.product_page_url,
+    }
+
+
 def find_product_by_multi_sku(child_sku: str, parent_sku: str = None, unique_id: str = None) -> Optional[Dict]:
     """
     Find a product by searching multiple SKU formats with priority matching.
@@ -107,7 +266,7 @@ def find_product_by_multi_sku(child_sku: str, parent_sku: str = None, unique_id:
         unique_id (str, optional): Unique ID (lowest priority)
         
     Returns:
-        dict with keys: product_data, matched_sku, match_type
+        dict with keys: product_summary, matched_sku, match_type
         or None if no match found
     """
     try:
@@ -143,27 +302,8 @@ def find_product_by_multi_sku(child_sku: str, parent_sku: str = None, unique_id:
             for product in products:
                 if product.sku == search_sku:
                     # Found match - return with priority info
-                    product_dict = {
-                        'Unique ID': product.sku,
-                        'Product Name': product.product_name,
-                        'Brand': product.brand,
-                        'Category': product.category,
-                        'Series': product.series,
-                        'Family': product.family,
-                        'Length': float(product.length) if product.length else None,
-                        'Width': float(product.width) if product.width else None,
-                        'Height': float(product.height) if product.height else None,
-                        'Nominal Dimensions': product.nominal_dimensions,
-                        'Product Page URL': product.product_page_url,
-                        'Image URL': product.image_url,
-                        'Ranking': product.ranking,
-                    }
-                    
-                    if product.attributes:
-                        product_dict.update(product.attributes)
-                    
                     return {
-                        'product_data': product_dict,
+                        'product_summary': _product_summary(product),
                         'matched_sku': product.sku,
                         'match_type': sku_types[i]
                     }
@@ -175,6 +315,35 @@ def find_product_by_multi_sku(child_sku: str, parent_sku: str = None, unique_id:
         return None
 
 
+# Keys a compatible product can carry in API responses (the last two only when set)
+COMPATIBLE_PRODUCT_FIELDS = ('sku', 'name', 'brand', 'series', 'category', 'product_page_url', 'image_url',
+                             'compatibility_score', 'glass_thickness', 'door_type')
+
+
+def _compatible_row_to_dict(row) -> Dict:
+    """Build the API dict for a compatible product row (sku, name, brand, series, category, urls, attributes, score)"""
+    product_data = {
+        'sku': row[0],
+        'name': row[1],
+        'brand': row[2],
+        'series': row[3],
+        'category': row[4],
+        'product_page_url': row[5],
+        'image_url': row[6],
+        'compatibility_score': row[8],
+    }
+    
+    # Add attributes from JSON field (glass_thickness, door_type, etc.)
+    attributes = row[7]  # p.attributes
+    if attributes:
+        if 'Glass Thickness' in attributes:
+            product_data['glass_thickness'] = attributes['Glass Thickness']
+        if 'Door Type' in attributes:
+            product_data['door_type'] = attributes['Door Type']
+    
+    return product_data
+
+
 def load_compatible_products_from_database(sku: str) -> Optional[Dict]:
     """
     Load compatible products from the database for a given SKU.
@@ -223,31 +392,8 @@ def load_compatible_products_from_database(sku: str) -> Optional[Dict]:
             compatible_products_by_category = {}
             
             for row in rows:
-                category = row[4]  # p.category
-                
-                if category not in compatible_products_by_category:
-                    compatible_products_by_category[category] = []
-                
-                product_data = {
-                    'sku': row[0],
-                    'name': row[1],
-                    'brand': row[2],
-                    'series': row[3],
-                    'category': category,
-                    'product_page_url': row[5],
-                    'image_url': row[6],
-                    'compatibility_score': row[8],
-                }
-                
-                # Add attributes from JSON field (glass_thickness, door_type, etc.)
-                attributes = row[7]  # p.attributes
-                if attributes:
-                    if 'Glass Thickness' in attributes:
-                        product_data['glass_thickness'] = attributes['Glass Thickness']
-                    if 'Door Type' in attributes:
-                        product_data['door_type'] = attributes['Door Type']
-                
-                compatible_products_by_category[category].append(product_data)
+                product_data = _compatible_row_to_dict(row)
+                compatible_products_by_category.setdefault(product_data['category'], []).append(product_data)
             
             logger.info(f"Loaded {len(rows)} compatible products from database for {sku}")
             return compatible_products_by_category
@@ -257,7 +403,184 @@ def load_compatible_products_from_database(sku: str) -> Optional[Dict]:
         return None
 
 
-def get_all_products_from_database(category: Optional[str] = None, limit: int = 100, offset: int = 0) -> Tuple[list, int]:
+def load_compatible_products_page_from_database(sku: str, limit_per_category: int) -> Optional[Tuple[Dict, Dict]]:
+    """
+    Load at most limit_per_category compatible products per category for a given SKU,
+    with each category's full count. Truncation and counting run in PostgreSQL, so
+    rows past the limit are never transferred.
+    
+    Args:
+        sku (str): Base product SKU
+        limit_per_category (int): Maximum products returned per category (must be positive)
+        
+    Returns:
+        tuple or None: (products by category, total count by category), or None if
+        not found/not computed
+    """
+    try:
+        from sqlalchemy import text
+        from models import get_engine
+        
+        engine = get_engine()
+        
+        with engine.connect() as conn:
+            # Same rows and order as load_compatible_products_from_database, ranked
+            # within each category so only the top rows leave the database
+            result = conn.execute(text("""
+                SELECT 
+                    sku, 
+                    product_name, 
+                    brand, 
+                    series, 
+                    category,
+                    product_page_url,
+                    image_url,
+                    attributes,
+                    compatibility_score,
+                    category_total
+                FROM (
+                    SELECT 
+                        p.sku, 
+                        p.product_name, 
+                        p.brand, 
+                        p.series, 
+                        p.category,
+                        p.product_page_url,
+                        p.image_url,
+                        p.attributes,
+                        pc.compatibility_score,
+                        row_number() OVER (PARTITION BY p.category ORDER BY pc.compatibility_score DESC) AS category_rank,
+                        count(*) OVER (PARTITION BY p.category) AS category_total
+                    FROM product_compatibility pc
+                    JOIN products p ON pc.compatible_product_id = p.id
+                    WHERE pc.base_product_id = (
+                        SELECT id FROM products WHERE sku = :sku LIMIT 1
+                    )
+                    AND (pc.incompatibility_reason IS NULL OR pc.incompatibility_reason = '')
+                ) ranked
+                WHERE category_rank <= :limit
+                ORDER BY compatibility_score DESC
+            """), {"sku": sku.upper(), "limit": limit_per_category})
+            
+            rows = result.fetchall()
+            
+            if not rows:
+                logger.info(f"No pre-computed compatibilities for {sku}, will use live computation")
+                return None
+            
+            compatible_products_by_category = {}
+            totals_by_category = {}
+            
+            for row in rows:
+                product_data = _compatible_row_to_dict(row)
+                category = product_data['category']
+                compatible_products_by_category.setdefault(category, []).append(product_data)
+                totals_by_category[category] = row[9]  # category_total
+            
+            logger.info(f"Loaded {len(rows)} compatible products from database for {sku} (limit {limit_per_category} per category)")
+            return compatible_products_by_category, totals_by_category
+        
+    except Exception as e:
+        logger.error(f"Error loading compatibilities from database: {str(e)}")
+        return None
+
+
+def load_product_with_compatibles_from_database(sku: str, fallback_sku: Optional[str] = None,
+                                                limit_per_category: Optional[int] = None) -> Optional[Tuple[Dict, Optional[Dict], Optional[Dict]]]:
+    """
+    Load a product summary and its compatible products in a single query.
+
+    The base product is sku, or fallback_sku when sku does not exist, and is
+    joined to its ranked compatibilities in a CTE, so the API does one round trip
+    instead of a product lookup followed by a compatibility lookup.
+
+    Args:
+        sku (str): Product SKU to load
+        fallback_sku (str, optional): SKU to use when sku is not found
+        limit_per_category (int, optional): Maximum products returned per category;
+            None returns every compatible product
+
+    Returns:
+        tuple or None: (product summary, products by category, total count by
+        category), or None if neither SKU is found. Both dicts are None when the
+        product has no pre-computed compatibilities.
+    """
+    try:
+        from sqlalchemy import text
+        from models import get_engine
+
+        engine = get_engine()
+        sku = sku.upper()
+
+        with engine.connect() as conn:
+            # LEFT JOIN keeps one row for a product without compatibilities; rank 1 of
+            # every category always passes the limit, so it never drops the product
+            result = conn.execute(text("""
+                WITH base AS (
+                    SELECT id, sku, product_name, brand, category, series, family, image_url, product_page_url
+                    FROM products
+                    WHERE sku IN (:sku, :fallback_sku)
+                    ORDER BY sku = :sku DESC
+                    LIMIT 1
+                ),
+                ranked AS (
+                    SELECT
+                        p.sku,
+                        p.product_name,
+                        p.brand,
+                        p.series,
+                        p.category,
+                        p.product_page_url,
+                        p.image_url,
+                        p.attributes,
+                        pc.compatibility_score,
+                        row_number() OVER (PARTITION BY p.category ORDER BY pc.compatibility_score DESC) AS category_rank,
+                        count(*) OVER (PARTITION BY p.category) AS category_total
+                    FROM base b
+                    JOIN product_compatibility pc ON pc.base_product_id = b.id
+                    JOIN products p ON pc.compatible_product_id = p.id
+                    WHERE (pc.incompatibility_reason IS NULL OR pc.incompatibility_reason = '')
+                )
+                SELECT
+                    b.sku, b.product_name, b.brand, b.category, b.series, b.family, b.image_url, b.product_page_url,
+                    r.sku, r.product_name, r.brand, r.series, r.category, r.product_page_url, r.image_url,
+                    r.attributes, r.compatibility_score, r.category_total
+                FROM base b
+                LEFT JOIN ranked r ON (CAST(:limit AS INTEGER) IS NULL OR r.category_rank <= :limit)
+                ORDER BY r.compatibility_score DESC NULLS LAST
+            """), {"sku": sku, "fallback_sku": (fallback_sku or sku).upper(), "limit": limit_per_category})
+
+            rows = result.fetchall()
+
+        if not rows:
+            return None
+
+        # The first eight columns repeat the base product on every row
+        product_summary = dict(zip(PRODUCT_SUMMARY_FIELDS, rows[0][:8]))
+
+        if rows[0][8] is None:
+            logger.info(f"No pre-computed compatibilities for {product_summary['sku']}, will use live computation")
+            return product_summary, None, None
+
+        compatible_products_by_category = {}
+        totals_by_category = {}
+
+        for row in rows:
+            product_data = _compatible_row_to_dict(tuple(row[8:]))
+            category = product_data['category']
+            compatible_products_by_category.setdefault(category, []).append(product_data)
+            totals_by_category[category] = row[17]  # category_total
+
+        logger.info(f"Loaded {product_summary['sku']} and {len(rows)} compatible products from database in one query")
+        return product_summary, compatible_products_by_category, totals_by_category
+
+    except Exception as e:
+        logger.error(f"Error loading product with compatibilities from database: {str(e)}")
+        return None
+
+
+def get_all_products_from_database(category: Optional[str] = None, limit: int = 100, offset: int = 0,
+                                   brand: Optional[str] = None) -> Tuple[list, int]:
     """
     Get all products from the database with optional filtering and pagination.
     
@@ -265,9 +588,10 @@ def get_all_products_from_database(category: Optional[str] = None, limit: int =
         category (str, optional): Filter by category
         limit (int): Number of products to return
         offset (int): Number of products to skip
+        brand (str, optional): Case-insensitive substring the brand must contain
         
     Returns:
-        tuple: (list of products, total count)
+        tuple: (list of products, total count matching the filters)
     """
     try:
         session = get_session()
@@ -275,6 +599,10 @@ def get_all_products_from_database(category: Optional[str] = None, limit: int =
         query = session.query(Product)
         if category:
             query = query.filter_by(category=category)
+        if brand:
+            # Escape LIKE wildcards so the brand is matched literally
+            pattern = brand.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            query = query.filter(Product.brand.ilike(f"%{pattern}%", escape='\\'))
         
         total_count = query.count()
         products = query.offset(offset).limit(limit).all()
@@ -317,7 +645,8 @@ def get_data_source_info() -> Dict:
     Returns:
         dict: Information about data source
     """
-    db_ready = check_database_ready()
+    # Health reporting reflects the live state, not the cached answer
+    db_ready = check_database_ready_uncached()
     
     info = {
         'database_available': db_available,
@@ -343,6 +672,86 @@ def get_data_source_info() -> Dict:
     return info
 
 
+def _workbook_snapshot_path(excel_path: str) -> str:
+    """Path of the parsed-workbook snapshot kept next to an Excel file"""
+    return f"{excel_path}.snapshot.pkl"
+
+
+def excel_workbook_version(excel_path: str) -> str:
+    """
+    Content-derived version of an Excel file, the same in every process that
+    reads the same file.
+    
+    Args:
+        excel_path: Path to the Excel file
+        
+    Returns:
+        str: "<st_mtime_ns>-<st_size>" of the file
+    """
+    stat = os.stat(excel_path)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def read_excel_workbook(excel_path: str) -> Dict[str, pd.DataFrame]:
+    """
+    Read every sheet of an Excel workbook, reusing a pickled snapshot of the
+    parsed DataFrames while the workbook itself is unchanged.
+    
+    Args:
+        excel_path: Path to the Excel file
+        
+    Returns:
+        dict: Sheet name -> DataFrame
+    """
+    stat = os.stat(excel_path)
+    source = (stat.st_mtime_ns, stat.st_size)
+    snapshot_path = _workbook_snapshot_path(excel_path)
+    
+    if os.path.exists(snapshot_path):
+        try:
+            snapshot = pd.read_pickle(snapshot_path)
+            if snapshot.get('source') == source:
+                logger.info(f"Loaded {excel_path} from snapshot {snapshot_path}")
+                return snapshot['sheets']
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable snapshot {snapshot_path}: {str(e)}")
+    
+    # sheet_name=None parses the workbook once and returns every sheet
+    sheets = pd.read_excel(excel_path, sheet_name=None)
+    
+    # Write to a temporary file of this writer's own first, so readers never see
+    # a partial snapshot and concurrent workers never replace each other's half-written file
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(snapshot_path) or '.', suffix='.tmp')
+        with os.fdopen(fd, 'wb') as tmp_file:
+            pd.to_pickle({'source': source, 'sheets': sheets}, tmp_file)
+        os.replace(tmp_path, snapshot_path)
+    except Exception as e:
+        logger.warning(f"Failed to write workbook snapshot {snapshot_path}: {str(e)}")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    
+    return sheets
+
+
+def move_excel_workbook(src_path: str, dst_path: str) -> None:
+    """
+    Move an Excel file, carrying its parsed snapshot along so the workbook
+    is not parsed again from its new location.
+    
+    Args:
+        src_path: Current path of the Excel file
+        dst_path: Destination path
+    """
+    shutil.move(src_path, dst_path)
+    
+    snapshot_path = _workbook_snapshot_path(src_path)
+    if os.path.exists(snapshot_path):
+        # A rename keeps the file's mtime and size, so the snapshot stays valid
+        os.replace(snapshot_path, _workbook_snapshot_path(dst_path))
+
+
 if __name__ == '__main__':
     logging.basicConfig(level=logging.INFO)
     
@@ -16,6 +16,7 @@ import schedule
 import ftplib
 from datetime import datetime
 from pathlib import Path
+import data_loader
 
 # Try to import the email notification system
 try:
@@ -60,20 +61,57 @@ class Config:
     
     # Number of backup files to keep
     MAX_BACKUPS = int(os.environ.get('MAX_BACKUPS', '7'))
+    
+    # "process" runs this service on its own (python data_update_service.py)
+    # instead of as a thread in every app worker; workers then only reload
+    # CURRENT_FILE when the service has replaced it on disk
+    SERVICE_MODE = os.environ.get('DATA_UPDATE_SERVICE_MODE', 'thread').lower()
 
 # Global variable to hold the data
 product_data_cache = {}
 last_update_time = None
+# Version of the workbook behind product_data_cache (see data_loader.excel_workbook_version);
+# unlike last_update_time it is the same in every worker that loaded the same file
+data_version = None
 data_lock = threading.RLock()
 
+# (name, size, modification time) of the FTP file behind the loaded data,
+# and of the file fetched by the update in progress
+last_ftp_source = None
+downloaded_ftp_source = None
+
+# (st_mtime_ns, st_size) of CURRENT_FILE as last loaded in "process" mode
+shared_file_source = None
+shared_file_lock = threading.Lock()
+
 def ensure_directories():
     """Ensure necessary directories exist"""
     Config.DATA_DIR.mkdir(exist_ok=True)
     Config.BACKUP_DIR.mkdir(exist_ok=True)
     logger.info(f"Ensured data directories exist: {Config.DATA_DIR}, {Config.BACKUP_DIR}")
 
+def get_ftp_file_source(ftp, filename):
+    """Return (name, size, modification time) of a remote file, or None if the server cannot report them"""
+    try:
+        # SIZE needs binary mode on most servers
+        ftp.voidcmd('TYPE I')
+        size = ftp.size(filename)
+        modified = ftp.voidcmd(f'MDTM {filename}').split()[-1]
+        return (filename, size, modified)
+    except ftplib.all_errors as e:
+        logger.warning(f"Could not read size/modification time of {filename}: {str(e)}")
+        return None
+
 def download_from_ftp():
-    """Download the latest file from FTP server that matches the prefix and has the most recent date suffix"""
+    """
+    Download the latest file from FTP server that matches the prefix and has the most recent date suffix.
+    
+    Returns:
+        True once downloaded, False on failure, or None when the newest remote
+        file is the one already loaded and the download was skipped
+    """
+    global downloaded_ftp_source
+    
     if not all([Config.FTP_HOST, Config.FTP_USER, Config.FTP_PASSWORD]):
         logger.error("FTP credentials not provided. Set FTP_SERVER, FTP_USER, and FTP_PASSWORD environment variables.")
         return False
@@ -106,6 +144,13 @@ def download_from_ftp():
             
             logger.info(f"Found newest file: {newest_file}")
             
+            # Like an HTTP conditional GET: skip the transfer when the
+            # remote file has not changed since the last successful update
+            downloaded_ftp_source = get_ftp_file_source(ftp, newest_file)
+            if downloaded_ftp_source is not None and downloaded_ftp_source == last_ftp_source:
+                logger.info(f"{newest_file} is unchanged since the last update, skipping download")
+                return None
+            
             # Download file
             logger.info(f"Downloading {newest_file} to {Config.TEMP_FILE}")
             with open(Config.TEMP_FILE, 'wb') as f:
@@ -158,7 +203,8 @@ def validate_excel_file(file_path):
         
         # Process only sheets that are present in the file
         for sheet in [s for s in expected_sheets if s in xls.sheet_names]:
-            df = pd.read_excel(file_path, sheet_name=sheet)
+            # Only the header row is needed to check the columns
+            df = pd.read_excel(xls, sheet_name=sheet, nrows=0)
             
             # Check for basic columns that every sheet should have
             missing_basic_columns = [col for col in basic_required_columns if col not in df.columns]
@@ -218,47 +264,78 @@ def cleanup_old_backups():
 
 def load_data_into_memory(file_path):
     """Load the Excel data into memory"""
-    global product_data_cache, last_update_time
+    global product_data_cache, last_update_time, data_version
     
     try:
         logger.info(f"Loading data from {file_path} into memory")
         
+        # Taken before reading, so a file replaced meanwhile gets a new version on its own load
+        version = data_loader.excel_workbook_version(file_path)
+        
+        # Read all sheets in a single pass, outside the lock so readers
+        # keep using the current cache while the file is parsed
+        new_data_cache = data_loader.read_excel_workbook(file_path)
+        for sheet_name, df in new_data_cache.items():
+            logger.info(f"Loaded sheet: {sheet_name} ({len(df)} rows)")
+        
         with data_lock:
-            # Read all sheets from the Excel file
-            xls = pd.ExcelFile(file_path)
-            
-            # Create a new data cache
-            new_data_cache = {}
-            
-            # Load each sheet into the cache
-            for sheet_name in xls.sheet_names:
-                logger.info(f"Loading sheet: {sheet_name}")
-                new_data_cache[sheet_name] = pd.read_excel(file_path, sheet_name=sheet_name)
-            
             # Update the global cache with the new data
             product_data_cache = new_data_cache
             last_update_time = datetime.now()
+            data_version = version
             
             logger.info(f"Data loaded successfully. {len(new_data_cache)} sheets loaded.")
-            return True
+        return True
     except Exception as e:
         logger.error(f"Error loading data into memory: {str(e)}")
         return False
 
+def refresh_from_shared_file():
+    """Reload CURRENT_FILE into memory if the separate service process replaced it"""
+    global shared_file_source
+    
+    try:
+        stat = os.stat(Config.CURRENT_FILE)
+    except OSError:
+        return
+    
+    source = (stat.st_mtime_ns, stat.st_size)
+    if source == shared_file_source:
+        return
+    
+    with shared_file_lock:
+        # Another thread may have reloaded while this one waited
+        if source != shared_file_source and load_data_into_memory(Config.CURRENT_FILE):
+            shared_file_source = source
+
 def get_product_data():
     """Thread-safe function to access the product data cache"""
+    if Config.SERVICE_MODE == 'process':
+        refresh_from_shared_file()
     with data_lock:
         return product_data_cache.copy(), last_update_time
 
+def get_data_version():
+    """Content-derived version of the loaded data, used to key caches derived from it"""
+    if Config.SERVICE_MODE == 'process':
+        refresh_from_shared_file()
+    return data_version
+
 def update_data():
     """Main function to update the data"""
+    global last_ftp_source
+    
     logger.info("Starting data update process")
     
     # Ensure directories exist
     ensure_directories()
     
     # Download the file from FTP
-    if not download_from_ftp():
+    downloaded = download_from_ftp()
+    if downloaded is None:
+        logger.info("Data is already up to date")
+        return True
+    if not downloaded:
         logger.error("Failed to download file from FTP. Aborting update.")
         return False
     
@@ -278,7 +355,8 @@ def update_data():
     # If all successful, replace the current file with the new one
     try:
         logger.info(f"Replacing current file with new file")
-        shutil.move(Config.TEMP_FILE, Config.CURRENT_FILE)
+        data_loader.move_excel_workbook(str(Config.TEMP_FILE), str(Config.CURRENT_FILE))
+        last_ftp_source = downloaded_ftp_source
         logger.info("Data update process completed successfully")
         
         # Sync database with the new Excel file
@@ -4,7 +4,7 @@ import pandas as pd
 import logging
 from datetime import datetime
 from sqlalchemy.exc import IntegrityError
-from models import get_session, get_engine, Product, ProductCompatibility, CompatibilityOverride, Base
+from models import get_session, create_tables, Product, ProductCompatibility, CompatibilityOverride
 from logic import compatibility
 
 logging.basicConfig(
@@ -19,8 +19,7 @@ def create_schema():
     Create all database tables.
     """
     logger.info("Creating database schema...")
-    engine = get_engine()
-    Base.metadata.create_all(engine)
+    create_tables()
     logger.info("Database schema created successfully")
 
 
@@ -14,8 +14,8 @@ Usage:
 import os
 import logging
 import pandas as pd
-import json #
 from datetime import datetime
+from types import SimpleNamespace
 from typing import Set, List, Tuple
 
 logger = logging.getLogger(__name__)
@@ -23,7 +23,9 @@ logger = logging.getLogger(__name__)
 # Import database components
 try:
     from models import get_session, Product, ProductCompatibility
+    from sqlalchemy import insert
     from logic import compatibility
+    import data_loader
     DB_AVAILABLE = True
 except ImportError:
     logger.warning("Database modules not available")
@@ -68,32 +70,15 @@ def sync_database_from_excel(excel_path: str = None) -> dict:
     deleted_products = []
 
     try:
-        # Load Excel data
-        data = {}
-        xls = pd.ExcelFile(excel_path)
-        for sheet_name in xls.sheet_names:
-            data[sheet_name] = pd.read_excel(excel_path, sheet_name=sheet_name)
-
-        # --- SPEED IMPROVEMENT: Cache loaded Excel data to JSON for faster retrieval ---
-        # Parsing Excel is slow; JSON is near-instant for subsequent lookups
-        json_cache_path = os.path.join('data', 'product_data_cache.json')
-        try:
-            # Convert each DataFrame to a dictionary for JSON serialization
-            serializable_data = {sheet: df.to_dict(orient='records') for sheet, df in data.items()}
-            with open(json_cache_path, 'w') as f:
-                # Use a custom handler for non-serializable objects (like timestamps)
-                def json_serial(obj):
-                    if isinstance(obj, (datetime, pd.Timestamp)):
-                        return obj.isoformat()
-                    return str(obj)
-                json.dump(serializable_data, f, default=json_serial)
-            logger.info(f"Cached sync data to JSON at {json_cache_path}")
-        except Exception as cache_err:
-            logger.warning(f"Failed to cache data to JSON: {cache_err}")
-
-        # Get all existing SKUs from database
-        existing_skus = {p.sku for p in session.query(Product.sku).all()}
+        # Load Excel data (reuses the parsed snapshot while the file is unchanged)
+        data = data_loader.read_excel_workbook(excel_path)
+
+        # Load all existing products once instead of querying per row
+        existing_by_sku = {p.sku: p for p in session.query(Product).all()}
+        existing_skus = set(existing_by_sku)
         excel_skus = set()
+        # New products are collected here and bulk inserted after the scan
+        new_by_sku = {}
 
         # Process each category
         for category, df in data.items():
@@ -143,8 +128,8 @@ def sync_database_from_excel(excel_path: str = None) -> dict:
 
                 product_data['attributes'] = attributes
 
-                # Check if product exists
-                existing_product = session.query(Product).filter_by(sku=sku).first()
+                # Check if product exists (a SKU listed twice updates the pending row)
+                existing_product = existing_by_sku.get(sku) or new_by_sku.get(sku)
 
                 if existing_product:
                     # Update existing product and track changes
@@ -174,8 +159,7 @@ def sync_database_from_excel(excel_path: str = None) -> dict:
                         })
                 else:
                     # Add new product
-                    product = Product(**product_data)
-                    session.add(product)
+                    new_by_sku[sku] = SimpleNamespace(**product_data)
                     added += 1
                     added_products.append({
                         'sku': sku,
@@ -183,10 +167,15 @@ def sync_database_from_excel(excel_path: str = None) -> dict:
                         'category': category
                     })
 
-            # Commit after each category
-            if (added + updated) % 100 == 0:
-                session.commit()
-                logger.info(f"Progress: {added} new, {updated} updated")
+            # No commit here: committing would expire every loaded Product and
+            # bring back one refresh SELECT per row on the next category
+            logger.info(f"Progress: {added} new, {updated} updated")
+
+        # Bulk insert new products with multi-row INSERTs, committing every 1000 rows
+        new_rows = [vars(p) for p in new_by_sku.values()]
+        for i in range(0, len(new_rows), 1000):
+            session.execute(insert(Product), new_rows[i:i + 1000])
+            session.commit()
 
         # Find deleted products (in DB but not in Excel)
         deleted_skus = existing_skus - excel_skus
@@ -8,6 +8,7 @@ Processes only NEW products (not already in database) with fast indexed lookups
 import sys
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Set, Tuple
 from models import get_session, Product, ProductCompatibility
 from logic import base_compatibility
@@ -189,6 +190,20 @@ def get_new_products(session) -> List[Product]:
     ).all()
 
 
+def insert_compatibility_records(records: List[Dict]) -> int:
+    """Bulk insert compatibility records in their own session (safe to run on a worker thread)"""
+    session = get_session()
+    try:
+        session.bulk_insert_mappings(ProductCompatibility, records)
+        session.commit()
+        return len(records)
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
 def compute_incremental(batch_size: int = 50, verbose: bool = True) -> Tuple[int, int]:
     """
     Compute compatibilities for new products only
@@ -227,42 +242,54 @@ def compute_incremental(batch_size: int = 50, verbose: bool = True) -> Tuple[int
         total_compatibilities = 0
         start_time = time.time()
         
-        for i in range(0, len(new_products), batch_size):
-            batch = new_products[i:i + batch_size]
-            batch_records = []
-            
-            # Compute compatibilities for each product in batch
-            for product in batch:
-                records = compute_product_compatibilities(product, index)
-                batch_records.extend(records)
-            
-            # Deduplicate batch_records based on (base_product_id, compatible_product_id)
-            seen = set()
-            unique_records = []
-            for record in batch_records:
-                key = (record['base_product_id'], record['compatible_product_id'])
-                if key not in seen:
-                    seen.add(key)
-                    unique_records.append(record)
+        # Inserts run on a single writer thread so the next batch is computed
+        # while the previous one is written. The writer uses its own session,
+        # which also keeps the indexed products from being expired by commits.
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            pending_insert = None
             
-            # Bulk insert batch
-            if unique_records:
-                session.bulk_insert_mappings(ProductCompatibility, unique_records)
-                session.commit()
-                total_compatibilities += len(unique_records)
-            
-            # Progress update
-            if verbose:
-                elapsed = time.time() - start_time
-                processed = min(i + batch_size, len(new_products))
-                rate = processed / elapsed if elapsed > 0 else 0
-                remaining = len(new_products) - processed
-                eta = remaining / rate if rate > 0 else 0
+            for i in range(0, len(new_products), batch_size):
+                batch = new_products[i:i + batch_size]
+                batch_records = []
+                
+                # Compute compatibilities for each product in batch
+                for product in batch:
+                    records = compute_product_compatibilities(product, index)
+                    batch_records.extend(records)
+                
+                # Deduplicate batch_records based on (base_product_id, compatible_product_id)
+                seen = set()
+                unique_records = []
+                for record in batch_records:
+                    key = (record['base_product_id'], record['compatible_product_id'])
+                    if key not in seen:
+                        seen.add(key)
+                        unique_records.append(record)
                 
-                print(f"[{processed}/{len(new_products)}] "
-                      f"+{len(batch_records)} compatibilities | "
-                      f"{rate:.1f} products/sec | "
-                      f"ETA: {eta/60:.1f}min")
+                # Wait for the previous insert so at most one batch is in flight
+                if pending_insert is not None:
+                    total_compatibilities += pending_insert.result()
+                    pending_insert = None
+                
+                # Bulk insert batch
+                if unique_records:
+                    pending_insert = writer.submit(insert_compatibility_records, unique_records)
+                
+                # Progress update
+                if verbose:
+                    elapsed = time.time() - start_time
+                    processed = min(i + batch_size, len(new_products))
+                    rate = processed / elapsed if elapsed > 0 else 0
+                    remaining = len(new_products) - processed
+                    eta = remaining / rate if rate > 0 else 0
+                    
+                    print(f"[{processed}/{len(new_products)}] "
+                          f"+{len(batch_records)} compatibilities | "
+                          f"{rate:.1f} products/sec | "
+                          f"ETA: {eta/60:.1f}min")
+            
+            if pending_insert is not None:
+                total_compatibilities += pending_insert.result()
         
         elapsed = time.time() - start_time
         
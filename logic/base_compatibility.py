@@ -438,7 +438,17 @@ def find_base_compatibilities(data, base_info):
             nominal_matches = []
             cut_candidates = []
 
-            for _, wall in walls_df.iterrows():
+            # Cheap vectorized prefilter on Type so the per-row rules below only
+            # run on walls whose type can match this base's installation
+            wall_types = walls_df["Type"].astype(str).str.lower() if "Type" in walls_df.columns \
+                else pd.Series("", index=walls_df.index)
+            candidate_mask = pd.Series(False, index=walls_df.index)
+            if base_install in ["alcove", "alcove or corner"]:
+                candidate_mask |= wall_types.str.contains("alcove shower", regex=False)
+            if base_install in ["corner", "alcove or corner"]:
+                candidate_mask |= wall_types.str.contains("corner shower", regex=False)
+
+            for _, wall in walls_df[candidate_mask].iterrows():
                 wall_type = str(wall.get("Type", "")).lower()
                 wall_brand = wall.get("Brand")
                 wall_series = wall.get("Series")
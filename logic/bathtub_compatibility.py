@@ -243,13 +243,30 @@ def find_bathtub_compatibilities(data, bathtub_info):
     logger.info(f"Tub brand: {tub_brand}, Tub family: {tub_family}, Tub series: {tub_series}")
     logger.info(f"Tub length: {tub_length}, Tub width: {tub_width_actual}")
 
+    # The series and family rules only depend on the wall's own value, so evaluate
+    # them once per distinct value and map the result back onto the rows
+    series_ok = {
+        series: series_compatible(tub_series, series)
+        for series in walls_df["Series"].unique()
+    }
+    family_ok = {
+        family: bathtub_brand_family_match(tub_brand, tub_family, None, family)
+        for family in walls_df["Family"].unique()
+    }
+
+    # Masks shared by both wall steps, computed in a single pass over the sheet
+    tub_wall_mask = (
+        walls_df["Type"].str.contains("tub", case=False, na=False) &
+        walls_df["Series"].map(series_ok).astype(bool) &
+        walls_df["Family"].map(family_ok).astype(bool)
+    )
+    cut_to_size_mask = walls_df["Cut to Size"] == "Yes"
+
     # Step 1: exact nominal matches (Cut to Size != "Yes")
     nominal_walls = walls_df[
-        (walls_df["Type"].str.lower().str.contains("tub", na=False)) &
-        (walls_df["Cut to Size"] != "Yes") &
-        (walls_df["Nominal Dimensions"] == tub_nominal) &
-        (walls_df["Series"].apply(lambda x: series_compatible(tub_series, x))) &
-        (walls_df.apply(lambda x: bathtub_brand_family_match(tub_brand, tub_family, x["Brand"], x["Family"]), axis=1))
+        tub_wall_mask &
+        ~cut_to_size_mask &
+        (walls_df["Nominal Dimensions"] == tub_nominal)
     ]
 
     for _, wall in nominal_walls.iterrows():
@@ -273,10 +290,8 @@ def find_bathtub_compatibilities(data, bathtub_info):
     # Step 2: Cut to Size walls (only closest size)
     # Only include walls that are large enough to fit the bathtub
     cut_walls_candidates = walls_df[
-        (walls_df["Type"].str.lower().str.contains("tub", na=False)) &
-        (walls_df["Cut to Size"] == "Yes") &
-        (walls_df["Series"].apply(lambda x: series_compatible(tub_series, x))) &
-        (walls_df.apply(lambda x: bathtub_brand_family_match(tub_brand, tub_family, x["Brand"], x["Family"]), axis=1)) &
+        tub_wall_mask &
+        cut_to_size_mask &
         pd.notna(walls_df["Length"]) & pd.notna(walls_df["Width"]) &
         (walls_df["Length"] >= tub_length) & (walls_df["Width"] >= tub_width_actual)
     ].copy()
@@ -20,8 +20,9 @@ def _load_blacklist():
     cache = set()
     if os.path.exists(blacklist_path):
         try:
-            df = pd.read_excel(blacklist_path) if blacklist_path.endswith(".xlsx") \
-                 else pd.read_csv(blacklist_path)
+            # Only the two SKU columns are used
+            df = pd.read_excel(blacklist_path, usecols=[0, 1]) if blacklist_path.endswith(".xlsx") \
+                 else pd.read_csv(blacklist_path, usecols=[0, 1])
 
             # Expect at least two columns
             col1, col2 = df.columns[:2]
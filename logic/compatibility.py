@@ -4,6 +4,7 @@ import logging
 import glob
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from logic import base_compatibility
 from logic import bathtub_compatibility
@@ -12,6 +13,7 @@ from logic import tubshower_compatibility
 from logic import image_handler
 from logic import blacklist_helper
 from logic import whitelist_helper
+import data_loader
 
 # Global flag to indicate whether the data update service is available
 data_service_available = False
@@ -26,6 +28,57 @@ except ImportError:
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Data parsed by the file fallback in load_data(), reused while the
+# workbooks' (path, mtime, size) signature is unchanged
+_file_data_signature = None
+_file_data = {}
+
+
+# Upper-cased Unique ID -> (sheet name, row position) for the sheets last passed
+# to _locate_sku(); rebuilt only when different DataFrames come in
+_sku_index = {'names': (), 'frames': (), 'rows': {}}
+
+
+def _locate_sku(data, sku):
+    """
+    Find the first sheet row whose Unique ID matches sku case-insensitively.
+
+    Args:
+        data (dict): Dictionary of DataFrames containing product data
+        sku (str): The SKU to search for
+
+    Returns:
+        tuple: (sheet name, row position) or None if not found
+    """
+    global _sku_index
+    names = tuple(data.keys())
+    frames = tuple(data.values())
+    cached = _sku_index
+    if not (names == cached['names'] and len(frames) == len(cached['frames'])
+            and all(a is b for a, b in zip(frames, cached['frames']))):
+        # Upper-case every sheet's IDs once per data load instead of per lookup;
+        # the first occurrence wins, matching a sheet-by-sheet scan
+        rows = {}
+        for name, df in data.items():
+            if 'Unique ID' in df.columns:
+                for position, unique_id in enumerate(df['Unique ID'].astype(str).str.upper().tolist()):
+                    rows.setdefault(unique_id, (name, position))
+        cached = {'names': names, 'frames': frames, 'rows': rows}
+        _sku_index = cached
+    return cached['rows'].get(str(sku).upper())
+
+
+def _nan_to_none(obj):
+    """Replace NaN floats copied from DataFrame cells with None so results are JSON-ready"""
+    if isinstance(obj, dict):
+        return {k: _nan_to_none(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_nan_to_none(v) for v in obj]
+    # NaN is the only float that is not equal to itself
+    if isinstance(obj, float) and obj != obj:
+        return None
+    return obj
+
 
 def find_tub_screen_compatibilities(data, screen_info):
     """
@@ -283,6 +336,18 @@ def get_fixed_door_type(product_info):
     return ""
 
 
+def _signature_version(signature):
+    """Content-derived data version for a (path, st_mtime_ns, st_size) file signature"""
+    return "|".join(f"{mtime_ns}-{size}" for _, mtime_ns, size in signature)
+
+
+def get_file_data_version():
+    """Version of the data last loaded from the data directory, or None if none was"""
+    if _file_data_signature is None:
+        return None
+    return _signature_version(_file_data_signature)
+
+
 def load_data():
     """
     Load product data either from the in-memory cache (if data update service is running) 
@@ -294,7 +359,7 @@ def load_data():
     data = {}
 
     # Try to get data from the data update service first
-    global data_service_available
+    global data_service_available, _file_data_signature, _file_data
     if data_service_available:
         try:
             # Import locally in case it wasn't available at module load time
@@ -329,8 +394,34 @@ def load_data():
             logger.warning("No Excel files found in the data directory")
             return data
 
+        # Reuse the previous parse while none of the files changed
+        signature = tuple(
+            (path, os.stat(path).st_mtime_ns, os.stat(path).st_size)
+            for path in excel_files
+        )
+        if signature == _file_data_signature:
+            logger.debug("Using product data already loaded from unchanged files")
+            return _file_data.copy()
+
+        # Read the workbooks concurrently; file and snapshot I/O release the GIL.
+        # Results are merged in file order so later files still win on sheet names
+        with ThreadPoolExecutor(max_workers=min(8, len(excel_files))) as executor:
+            # Reuses the parsed snapshot while the file is unchanged
+            workbooks = [
+                executor.submit(data_loader.read_excel_workbook, file_path)
+                for file_path in excel_files
+            ]
+
         # Load each Excel file, reading all worksheets
-        for file_path in excel_files:
+        for file_path, workbook in zip(excel_files, workbooks):
+            try:
+                data.update(workbook.result())
+                continue
+            except Exception as e:
+                logger.warning(
+                    f"Failed to read {file_path} in one pass, reading sheet by sheet: {str(e)}"
+                )
+
             try:
                 # Use pd.ExcelFile to get all sheet names, with engine explicitly specified
                 try:
@@ -355,10 +446,9 @@ def load_data():
                 # Load each worksheet into a separate DataFrame
                 for sheet_name in sheet_names:
                     try:
-                        # Try with openpyxl engine first
-                        df = pd.read_excel(file_path,
-                                           sheet_name=sheet_name,
-                                           engine='openpyxl')
+                        # Parse from the already opened workbook so the
+                        # shared strings are not re-read for every sheet
+                        df = excel.parse(sheet_name)
                     except Exception:
                         # If that fails, try with xlrd engine
                         try:
@@ -389,11 +479,16 @@ def load_data():
                 with data_service.data_lock:
                     data_service.product_data_cache = data.copy()
                     data_service.last_update_time = datetime.now()
+                    data_service.data_version = _signature_version(signature)
                 logger.info(
                     "Updated in-memory cache with data loaded from files")
             except Exception as e:
                 logger.error(f"Error updating in-memory cache: {str(e)}")
 
+        if data:
+            _file_data_signature = signature
+            _file_data = data.copy()
+
         return data
 
     except Exception as e:
@@ -409,7 +504,8 @@ def find_compatible_products(sku):
         sku (str): The SKU to search for
 
     Returns:
-        dict: Dictionary containing source product info and compatible products
+        dict: Dictionary containing source product info and compatible products,
+        with None in place of missing (NaN) values
     """
     # Import numpy for any potential nan values
     import numpy as np
@@ -424,40 +520,24 @@ def find_compatible_products(sku):
         # Find the product in the data
         product_info = None
         product_category = None
+        sku_upper = sku.upper()
 
-        for category, df in data.items():
-            # Check if 'Unique ID' column exists in the DataFrame (main identifier in the Excel file)
-            id_column = None
-            for col in df.columns:
-                if col == 'Unique ID':
-                    id_column = col
-                    break
-
-            if id_column is None:
-                logger.warning(f"No Unique ID column found in {category} data")
-                continue
-
-            # Try to find the SKU in this category
-            # Convert everything to string and uppercase for case-insensitive comparison
-            product_row = df[df[id_column].astype(str).str.upper() ==
-                             sku.upper()]
-
-            if not product_row.empty:
-                # Store the exact match from this category
-                product_info = product_row.iloc[0].to_dict()
-                product_category = category
+        # Case-insensitive lookup of the SKU across all categories
+        location = _locate_sku(data, sku_upper)
+        if location is not None:
+            category, position = location
+            # Store the exact match from this category
+            product_info = data[category].iloc[position].to_dict()
+            product_category = category
 
-                # Ensure the source product info has the correct SKU
-                product_info['Unique ID'] = sku
+            # Ensure the source product info has the correct SKU
+            product_info['Unique ID'] = sku
 
-                # Log that we found the product and where
-                logger.debug(f"Found product in category: {category}")
-                logger.debug(
-                    f"Product name: {product_info.get('Product Name', 'Unknown')}"
-                )
-
-                # Since we found a direct match, stop searching other categories
-                break
+            # Log that we found the product and where
+            logger.debug(f"Found product in category: {category}")
+            logger.debug(
+                f"Product name: {product_info.get('Product Name', 'Unknown')}"
+            )
 
         if product_info is None:
             logger.warning(f"No product found for SKU: {sku}")
@@ -1651,19 +1731,15 @@ def find_compatible_products(sku):
         # Search all worksheets for the exact SKU to get the correct product information
         # This is a comprehensive solution to ensure we get the right product details
         # regardless of which worksheet it comes from
-        for sheet_name, df in data.items():
-            if 'Unique ID' in df.columns:
-                # Case-insensitive search for the SKU
-                matching_rows = df[df['Unique ID'].astype(str).str.upper() ==
-                                   sku.upper()]
-                if not matching_rows.empty:
-                    original_product_info = matching_rows.iloc[0].to_dict()
-                    logger.debug(
-                        f"Found original product in {sheet_name}: {original_product_info.get('Product Name', 'Unknown')}"
-                    )
-                    # Update the category if it's different
-                    product_category = sheet_name
-                    break  # Stop once we find a direct match
+        location = _locate_sku(data, sku)
+        if location is not None:
+            sheet_name, position = location
+            original_product_info = data[sheet_name].iloc[position].to_dict()
+            logger.debug(
+                f"Found original product in {sheet_name}: {original_product_info.get('Product Name', 'Unknown')}"
+            )
+            # Update the category if it's different
+            product_category = sheet_name
 
         # If we couldn't find the original product in any category, use what we have
         if original_product_info is None:
@@ -1737,7 +1813,7 @@ def find_compatible_products(sku):
         # Early return for shower bases with incompatibility reasons only
         if product_category == 'Shower Bases' and incompatibility_reasons and not compatible_products:
             logger.info(f"Early return for shower base with incompatibility reasons: {incompatibility_reasons}")
-            return {"product": source_product, "compatibles": [], "incompatibility_reasons": incompatibility_reasons}
+            return _nan_to_none({"product": source_product, "compatibles": [], "incompatibility_reasons": incompatibility_reasons})
 
         # Ensure every category dict has a "products" key (only for categories without incompatibility reasons)
         for cat in compatible_products:
@@ -1848,10 +1924,10 @@ def find_compatible_products(sku):
                     })
                     logger.info(f"Whitelist addition: Added new category {wl_category} with {len(wl_products)} whitelisted products")
             
-            return {
+            return _nan_to_none({
                 "product": source_product,
                 "compatibles": final_compatibles
-            }
+            })
 
         # === BLACKLIST helper and filter ===
         def _extract_sku(prod):
@@ -1894,16 +1970,10 @@ def find_compatible_products(sku):
             wl_row = get_product_details(data, wl_sku)
             if wl_row is None:
                 continue
-            wl_category = next(
-                (name for name, df in data.items()
-                 if "Unique ID" in df.columns
-                 and not df[df["Unique ID"].astype(str)
-                               .str.upper()
-                               .eq(wl_sku.upper())].empty),
-                None,
-            )
-            if wl_category is None:
+            wl_location = _locate_sku(data, wl_sku)
+            if wl_location is None:
                 continue
+            wl_category = wl_location[0]
 
             # Clean NaN values
             def _clean(v):
@@ -2006,7 +2076,7 @@ def find_compatible_products(sku):
         logger.info(f"About to return - incompatibility_reasons: {incompatibility_reasons}")
         logger.info(f"About to return - len(incompatibility_reasons): {len(incompatibility_reasons)}")
         
-        result = {"product": source_product, "compatibles": compatible_products, "incompatibility_reasons": incompatibility_reasons}
+        result = _nan_to_none({"product": source_product, "compatibles": compatible_products, "incompatibility_reasons": incompatibility_reasons})
         logger.info(f"Final result incompatibility_reasons: {result.get('incompatibility_reasons', {})}")
         return result
 
@@ -2031,32 +2101,25 @@ def get_product_details(data, sku):
     try:
         logger.debug(f"Looking for product details for SKU: {sku}")
 
-        for category, df in data.items():
-            # Skip any dataframes without a Unique ID column
-            if 'Unique ID' not in df.columns:
-                continue
+        # Case-insensitive lookup of the SKU across all categories
+        location = _locate_sku(data, sku)
+        if location is not None:
+            category, position = location
+            # Convert to dict and clean up NaN values
+            product_info = data[category].iloc[position].to_dict()
 
-            # Find the product in this category
-            # Convert everything to string and uppercase for case-insensitive comparison
-            product_row = df[df['Unique ID'].astype(str).str.upper() ==
-                             sku.upper()]
+            # Clean up NaN values in the dictionary
+            for key, value in product_info.items():
+                if pd.isna(value):
+                    product_info[key] = None
 
-            if not product_row.empty:
-                # Convert to dict and clean up NaN values
-                product_info = product_row.iloc[0].to_dict()
+            # Add the category to the product info
+            product_info['_source_category'] = category
 
-                # Clean up NaN values in the dictionary
-                for key, value in product_info.items():
-                    if pd.isna(value):
-                        product_info[key] = None
-
-                # Add the category to the product info
-                product_info['_source_category'] = category
-
-                logger.debug(
-                    f"Found product in {category}: {product_info.get('Product Name', 'Unknown')}"
-                )
-                return product_info
+            logger.debug(
+                f"Found product in {category}: {product_info.get('Product Name', 'Unknown')}"
+            )
+            return product_info
 
         logger.debug(f"No product found for SKU: {sku}")
         return None
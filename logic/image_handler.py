@@ -10,6 +10,17 @@ import urllib.parse
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import time rather than on every call
+SCHEME_PATTERN = re.compile(r'^https?://', re.IGNORECASE)
+
+# Simple URL pattern matching
+URL_PATTERN = re.compile(
+    r'^(https?://)?' # http:// or https:// (optional)
+    r'([a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}' # domain
+    r'(/[a-zA-Z0-9_.-]+)*/?$', # path (optional)
+    re.IGNORECASE
+)
+
 def generate_image_url(product_info):
     """
     Generate an image URL for a product based on available information.
@@ -113,7 +124,7 @@ def normalize_url(url):
     url = url.strip()
     
     # Add https:// if the URL doesn't have a scheme
-    if url and not re.match(r'^https?://', url, re.IGNORECASE):
+    if url and not SCHEME_PATTERN.match(url):
         url = 'https://' + url
     
     # URL-encode special characters
@@ -146,12 +157,4 @@ def is_valid_url(url):
     if not url or not isinstance(url, str):
         return False
     
-    # Simple URL pattern matching
-    url_pattern = re.compile(
-        r'^(https?://)?' # http:// or https:// (optional)
-        r'([a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}' # domain
-        r'(/[a-zA-Z0-9_.-]+)*/?$', # path (optional)
-        re.IGNORECASE
-    )
-    
-    return bool(url_pattern.match(url.strip()))
\ No newline at end of file
+    return bool(URL_PATTERN.match(url.strip()))
\ No newline at end of file
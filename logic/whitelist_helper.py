@@ -17,7 +17,9 @@ def _load_whitelist() -> set[frozenset]:
     pairs: set[frozenset] = set()
     if os.path.exists(path):
         try:
-            df = pd.read_excel(path) if path.endswith(".xlsx") else pd.read_csv(path)
+            # Only the two SKU columns are used
+            df = pd.read_excel(path, usecols=[0, 1]) if path.endswith(".xlsx") \
+                 else pd.read_csv(path, usecols=[0, 1])
             col1, col2 = df.columns[:2]
             for _, row in df.iterrows():
                 a = str(row[col1]).strip().upper()
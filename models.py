@@ -1,9 +1,10 @@
 import os
 from datetime import datetime
-from sqlalchemy import create_engine, Column, Integer, String, Text, DECIMAL, TIMESTAMP, Boolean, Index, ForeignKey, UniqueConstraint, JSON, desc
+from sqlalchemy import create_engine, Column, Integer, String, Text, DECIMAL, TIMESTAMP, Boolean, Index, ForeignKey, UniqueConstraint, JSON, desc, func, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from sqlalchemy.pool import QueuePool
+from sqlalchemy.exc import SQLAlchemyError
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,6 +15,9 @@ Base = declarative_base()
 _engine = None
 _engine_lock = None
 
+# Session factory bound to the engine, built once instead of per get_session() call
+_session_factory = None
+
 
 class Product(Base):
     """
@@ -58,6 +62,12 @@ class Product(Base):
         cascade='all, delete-orphan'
     )
     
+    __table_args__ = (
+        # The /suggest prefix search filters on UPPER(sku) LIKE 'query%'; text_pattern_ops
+        # lets that use a btree range scan whatever the database collation
+        Index('idx_product_sku_upper_pattern', func.upper(sku).label('sku_upper'), postgresql_ops={'sku_upper': 'text_pattern_ops'}),
+    )
+    
     def __repr__(self):
         return f"<Product(sku='{self.sku}', name='{self.product_name}', category='{self.category}')>"
 
@@ -145,6 +155,15 @@ class SyncStatus(Base):
         return f"<SyncStatus(type='{self.sync_type}', status='{self.status}', started='{self.started_at}')>"
 
 
+# Trigram indexes (pg_trgm) serving the ILIKE '%query%' substring searches behind
+# /suggest, which a btree index cannot. They are created by create_trigram_indexes()
+# rather than declared on Product, so create_all() works where pg_trgm cannot be installed
+TRIGRAM_INDEX_STATEMENTS = (
+    "CREATE INDEX IF NOT EXISTS idx_product_name_trgm ON products USING gin (product_name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_product_sku_trgm ON products USING gin (sku gin_trgm_ops)",
+)
+
+
 def get_engine():
     """
     Get or create a singleton database engine with connection pooling.
@@ -187,21 +206,51 @@ def get_engine():
 def get_session():
     """
     Create and return a database session.
+    Sessions check connections out of the engine's pool rather than opening new ones.
     """
-    engine = get_engine()
-    Session = sessionmaker(bind=engine)
-    return Session()
+    global _session_factory
+    
+    if _session_factory is None:
+        _session_factory = sessionmaker(bind=get_engine())
+    return _session_factory()
 
 
 def create_tables():
     """
-    Create all database tables defined in the models.
+    Create all database tables defined in the models, and any of their indexes
+    missing from tables that already exist.
     """
     engine = get_engine()
     Base.metadata.create_all(engine)
+    # create_all skips existing tables, so indexes added to a model since are created here
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    create_trigram_indexes()
     logger.info("Database tables created successfully")
 
 
+def create_trigram_indexes():
+    """
+    Create the pg_trgm extension and the trigram product search indexes.
+    Searches still work without them, only slower, so a database that refuses
+    (no CREATE privilege, not PostgreSQL) is logged and skipped.
+    
+    Returns:
+        bool: True if the indexes exist
+    """
+    engine = get_engine()
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            for statement in TRIGRAM_INDEX_STATEMENTS:
+                conn.execute(text(statement))
+        return True
+    except SQLAlchemyError as e:
+        logger.warning(f"Skipping trigram search indexes, pg_trgm is not available: {str(e)}")
+        return False
+
+
 def drop_tables():
     """
     Drop all database tables. Use with caution!
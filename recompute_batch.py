@@ -24,16 +24,12 @@ def load_excel_data():
         data_file = 'data/Product Data.xlsx'
     
     logger.info("Loading Excel data...")
-    data = {}
     sheets = ['Shower Bases', 'Bathtubs', 'Showers', 'Tub Showers', 'Shower Doors', 
               'Walls', 'Screens', 'Accessories']
     
-    for sheet in sheets:
-        try:
-            df = pd.read_excel(data_file, sheet_name=sheet)
-            data[sheet] = df
-        except:
-            pass
+    # Open the workbook once and parse every available sheet in one call
+    with pd.ExcelFile(data_file) as xls:
+        data = pd.read_excel(xls, sheet_name=[s for s in sheets if s in xls.sheet_names])
     
     return data
 
@@ -0,0 +1,136 @@
+"""
+Optional Redis cache shared by all app workers.
+
+Used when the redis package is installed and REDIS_URL is set. Every helper
+degrades to a no-op (or a cache miss) otherwise, so callers never need to
+check whether Redis is configured. Values are LZ4-compressed when the lz4
+package is installed.
+"""
+
+import os
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis
+    redis_available = True
+except ImportError:
+    redis_available = False
+
+try:
+    import lz4.frame
+    lz4_available = True
+except ImportError:
+    lz4_available = False
+
+# One-byte format tag prefixed to every stored value. JSON and hex ETags never
+# start with these bytes, so values written before tagging still read as raw
+_FORMAT_RAW = b"\x00"
+_FORMAT_LZ4 = b"\x01"
+
+# Live compatibility results, keyed by data version and SKU
+COMPAT_KEY_PREFIX = "compat:"
+COMPAT_TTL_SECONDS = 600
+
+# Encoded /api/compatible response bodies, keyed by the request's cache key
+API_COMPAT_KEY_PREFIX = "api:compatible:"
+API_COMPAT_TTL_SECONDS = 60
+
+_client = None
+
+
+def get_client():
+    """
+    Get or create the Redis client.
+
+    Returns:
+        redis.Redis or None if Redis is not configured
+    """
+    global _client
+
+    if _client is None and redis_available and os.environ.get('REDIS_URL'):
+        # Short timeouts so an unreachable Redis only costs a cache miss
+        _client = redis.Redis.from_url(
+            os.environ['REDIS_URL'],
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5,
+        )
+        logger.info("Redis cache enabled")
+    return _client
+
+
+def _encode(value) -> bytes:
+    """Tag a value and LZ4-compress it when lz4 is installed"""
+    if isinstance(value, str):
+        value = value.encode()
+    if lz4_available:
+        # Level 0 is LZ4's fast mode; cached JSON is highly repetitive
+        return _FORMAT_LZ4 + lz4.frame.compress(value, compression_level=0)
+    return _FORMAT_RAW + value
+
+
+def _decode(stored: bytes) -> Optional[bytes]:
+    """Undo _encode(); None if the value cannot be read by this process"""
+    tag = stored[:1]
+    if tag == _FORMAT_LZ4:
+        if not lz4_available:
+            return None
+        return lz4.frame.decompress(stored[1:])
+    if tag == _FORMAT_RAW:
+        return stored[1:]
+    # Untagged value from before compression was added
+    return stored
+
+
+def get_value(key: str) -> Optional[bytes]:
+    """Return the cached value for key, or None on a miss or Redis error"""
+    client = get_client()
+    if client is None:
+        return None
+    try:
+        stored = client.get(key)
+        return _decode(stored) if stored is not None else None
+    except Exception as e:
+        logger.warning(f"Redis get failed for {key}: {str(e)}")
+        return None
+
+
+def set_value(key: str, value, ttl: int = COMPAT_TTL_SECONDS) -> None:
+    """Store value under key with a TTL in seconds"""
+    client = get_client()
+    if client is None:
+        return
+    try:
+        client.setex(key, ttl, _encode(value))
+    except Exception as e:
+        logger.warning(f"Redis set failed for {key}: {str(e)}")
+
+
+def delete_prefix(prefix: str = COMPAT_KEY_PREFIX) -> int:
+    """
+    Delete every key starting with prefix.
+
+    Returns:
+        int: Number of keys deleted
+    """
+    client = get_client()
+    if client is None:
+        return 0
+    try:
+        deleted = 0
+        batch = []
+        # SCAN instead of KEYS so a large keyspace does not block Redis
+        for key in client.scan_iter(match=f"{prefix}*", count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                deleted += client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += client.unlink(*batch)
+        logger.info(f"Cleared {deleted} Redis keys with prefix {prefix}")
+        return deleted
+    except Exception as e:
+        logger.warning(f"Redis delete failed for prefix {prefix}: {str(e)}")
+        return 0
@@ -5,7 +5,7 @@ This helps the compatibility finder application display product images.
 """
 
 import os
-import pandas as pd
+import openpyxl
 import sys
 from pathlib import Path
 
@@ -19,9 +19,10 @@ def add_image_url_column(excel_path):
     try:
         print(f"Opening Excel file: {excel_path}")
         
-        # Use ExcelFile to get all sheet names, explicitly specify engine
-        xl = pd.ExcelFile(excel_path, engine='openpyxl')
-        sheet_names = xl.sheet_names
+        # Open the workbook once; only the header row of each sheet is touched,
+        # so untouched sheets are saved back without a pandas round trip
+        workbook = openpyxl.load_workbook(excel_path)
+        sheet_names = workbook.sheetnames
         print(f"Found {len(sheet_names)} sheets: {sheet_names}")
         
         # Create a backup first
@@ -30,29 +31,23 @@ def add_image_url_column(excel_path):
         shutil.copy2(excel_path, backup_path)
         print(f"Created backup at {backup_path}")
         
-        # Initialize ExcelWriter for saving changes
-        writer = pd.ExcelWriter(excel_path, engine='openpyxl')
-        
         # Process each sheet
         for sheet in sheet_names:
             print(f"\nProcessing sheet: {sheet}")
-            
-            # Read the entire sheet
-            df = pd.read_excel(excel_path, sheet_name=sheet, engine='openpyxl')
+            worksheet = workbook[sheet]
+            headers = [cell.value for cell in worksheet[1]]
             
             # Check if Image URL column already exists
-            if 'Image URL' in df.columns:
+            if 'Image URL' in headers:
                 print(f"Image URL column already exists in {sheet}")
             else:
-                # Add empty Image URL column
-                df['Image URL'] = ''
+                # Append an empty Image URL column after the last used column
+                new_column = worksheet.max_column + 1 if any(h is not None for h in headers) else 1
+                worksheet.cell(row=1, column=new_column, value='Image URL')
                 print(f"Added Image URL column to {sheet}")
-            
-            # Write the updated dataframe back to the Excel file
-            df.to_excel(writer, sheet_name=sheet, index=False)
         
-        # Save the Excel file
-        writer.close()
+        # Save the Excel file once
+        workbook.save(excel_path)
         print(f"\nSuccessfully updated {excel_path}")
         print("\nNow you can open the Excel file and add image URLs for your products.")
         print("After adding URLs, save the Excel file and restart the application.")
@@ -16,30 +16,25 @@ def check_for_product_page_urls():
     
     print(f"Checking {data_file} for Product Page URL values...")
     
+    # Parse every sheet in one pass, keeping only the columns this check reads
+    wanted_columns = {"Unique ID", "Product Page URL"}
+    
     # Try with different Excel engines
     try:
-        excel_file = pd.ExcelFile(data_file, engine='openpyxl')
+        sheets = pd.read_excel(data_file, sheet_name=None, engine='openpyxl',
+                               usecols=lambda col: col in wanted_columns)
     except Exception as e:
         print(f"Error with openpyxl: {e}")
         try:
-            excel_file = pd.ExcelFile(data_file, engine='xlrd')
+            sheets = pd.read_excel(data_file, sheet_name=None, engine='xlrd',
+                                   usecols=lambda col: col in wanted_columns)
         except Exception as e:
             print(f"Error with xlrd: {e}")
             return
     
-    sheets = excel_file.sheet_names
     urls_found = 0
     
-    for sheet in sheets:
-        try:
-            df = pd.read_excel(data_file, sheet_name=sheet, engine='openpyxl')
-        except Exception:
-            try:
-                df = pd.read_excel(data_file, sheet_name=sheet, engine='xlrd')
-            except Exception as e:
-                print(f"Error reading sheet {sheet}: {e}")
-                continue
-        
+    for sheet, df in sheets.items():
         # Check if "Product Page URL" column exists
         if "Product Page URL" in df.columns:
             # Count non-null values
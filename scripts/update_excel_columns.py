@@ -8,11 +8,15 @@ import os
 import pandas as pd
 import re
 import logging
+from openpyxl import Workbook
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Compiled once and reused for every product name
+GLASS_THICKNESS_PATTERN = re.compile(r'(\d+)[\s-]*mm')
+
 def extract_glass_thickness(name):
     """
     Extract glass thickness from product name
@@ -26,7 +30,7 @@ def extract_glass_thickness(name):
     if not name or not isinstance(name, str):
         return ''
     
-    match = re.search(r'(\d+)[\s-]*mm', str(name).lower())
+    match = GLASS_THICKNESS_PATTERN.search(str(name).lower())
     if match:
         return match.group(1) + 'mm'
     return ''
@@ -72,8 +76,8 @@ def update_excel_columns(file_path):
             logger.warning(f"Failed to read with openpyxl engine, trying xlrd: {str(e)}")
             excel_file = pd.ExcelFile(file_path, engine='xlrd')
         
-        # Create a writer to save the modified sheets
-        writer = pd.ExcelWriter('data/Product Data - Updated.xlsx', engine='openpyxl')
+        # Write-only workbook streams rows to disk instead of keeping every cell in memory
+        workbook = Workbook(write_only=True)
         
         # Process each sheet
         for sheet_name in excel_file.sheet_names:
@@ -81,7 +85,8 @@ def update_excel_columns(file_path):
             
             # Read the sheet
             try:
-                df = pd.read_excel(file_path, sheet_name=sheet_name, engine='openpyxl')
+                # Parse from the already opened workbook instead of reopening the file
+                df = excel_file.parse(sheet_name)
             except Exception:
                 try:
                     df = pd.read_excel(file_path, sheet_name=sheet_name, engine='xlrd')
@@ -101,11 +106,14 @@ def update_excel_columns(file_path):
                     df['Door Type'] = df['Product Name'].apply(determine_door_type)
                     logger.info("Added Door Type column")
             
-            # Write the modified sheet back to the Excel file
-            df.to_excel(writer, sheet_name=sheet_name, index=False)
+            # Write the modified sheet back to the Excel file (NaN becomes an empty cell)
+            worksheet = workbook.create_sheet(sheet_name)
+            worksheet.append(list(df.columns))
+            for row in df.astype(object).where(df.notna(), None).itertuples(index=False, name=None):
+                worksheet.append(row)
         
         # Save the Excel file
-        writer.close()
+        workbook.save('data/Product Data - Updated.xlsx')
         logger.info("Excel file updated successfully")
         
         # Replace the original file with the updated one
@@ -0,0 +1,19 @@
+import pytest
+
+
+@pytest.fixture
+def app_module(monkeypatch, tmp_path):
+    """Import app without starting its background services"""
+    # The data update service then leaves its FTP thread to the separate process
+    monkeypatch.setenv('DATA_UPDATE_SERVICE_MODE', 'process')
+    # data_update_service logs to data_update.log in the working directory
+    monkeypatch.chdir(tmp_path)
+
+    import compatibility_worker
+    monkeypatch.setattr(compatibility_worker, 'start_worker', lambda: None)
+
+    import app
+    app.clear_api_cache()
+    yield app
+    app.clear_api_cache()
+    compatibility_worker.stop_worker()
@@ -0,0 +1,107 @@
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+def _keys_in_one_shard(app, count):
+    """Cache keys that all land in the same shard as the first one"""
+    target = app._cache_shard('key-0')
+    keys = []
+    i = 0
+    while len(keys) < count:
+        key = f'key-{i}'
+        if app._cache_shard(key) is target:
+            keys.append(key)
+        i += 1
+    return keys
+
+
+def test_sharded_cache_evicts_least_recently_used(app_module):
+    """A full shard evicts its least recently used entry, not its oldest one"""
+    capacity = app_module._cache_max_size // app_module._cache_shard_count
+    keys = _keys_in_one_shard(app_module, capacity + 2)
+
+    for key in keys[:capacity]:
+        app_module.cache_compatibles(key, (key.encode(), key))
+
+    # Touch the oldest entry so the second one becomes least recently used
+    assert app_module.get_cached_compatibles(keys[0]) == (keys[0].encode(), keys[0])
+
+    app_module.cache_compatibles(keys[capacity], (b'new', 'new'))
+    assert app_module.get_cached_compatibles(keys[0]) is not None
+    assert app_module.get_cached_compatibles(keys[1]) is None
+
+    app_module.cache_compatibles(keys[capacity + 1], (b'newer', 'newer'))
+    assert app_module.get_cached_compatibles(keys[2]) is None
+    assert app_module.get_cached_compatibles(keys[capacity]) == (b'new', 'new')
+
+    app_module.clear_api_cache()
+    assert app_module.get_cached_compatibles(keys[0]) is None
+
+
+def test_if_none_match_returns_304(app_module):
+    """GET endpoints answer a matching If-None-Match with 304 and no body"""
+    client = app_module.app.test_client()
+
+    first = client.get('/suggest?q=ab')
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+    assert first.headers['Cache-Control']
+
+    revalidated = client.get('/suggest?q=ab', headers={'If-None-Match': etag})
+    assert revalidated.status_code == 304
+    assert revalidated.get_data() == b''
+
+    changed = client.get('/suggest?q=ab', headers={'If-None-Match': '"stale"'})
+    assert changed.status_code == 200
+
+
+def _fake_compatible_lookup(sku, fallback_sku=None, limit_per_category=None):
+    """Stand-in for the combined product + compatibilities query"""
+    import data_loader
+
+    summary = {field: None for field in data_loader.PRODUCT_SUMMARY_FIELDS}
+    summary.update({'sku': sku, 'name': 'Test Base', 'category': 'Shower Bases'})
+    doors = [
+        {'sku': f'DOOR{i}', 'name': f'Door {i}', 'brand': 'MAAX', 'series': 'Test',
+         'category': 'Shower Doors', 'product_page_url': f'https://example.com/door{i}',
+         'image_url': f'https://example.com/door{i}.jpg', 'compatibility_score': 900 - i}
+        for i in range(3)
+    ]
+    return summary, {'Shower Doors': doors}, {'Shower Doors': len(doors)}
+
+
+def _get_compatible(app, monkeypatch, query_string):
+    """Call /api/compatible against the fake database lookup"""
+    data_loader = app.data_loader
+    monkeypatch.setattr(data_loader, 'check_database_ready', lambda: True)
+    monkeypatch.setattr(data_loader, 'get_known_skus', lambda *args: None)
+    monkeypatch.setattr(data_loader, 'get_database_generation', lambda: None)
+    monkeypatch.setattr(data_loader, 'load_product_with_compatibles_from_database', _fake_compatible_lookup)
+    app.clear_api_cache()
+
+    response = app.app.test_client().get(f'/api/compatible/FB03060M{query_string}')
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['success']
+    return body['compatibles'][0]['products']
+
+
+def test_fields_projection(app_module, monkeypatch):
+    """?fields= keeps only the requested keys, ignoring unknown ones"""
+    products = _get_compatible(app_module, monkeypatch, '?fields=sku,image_url,bogus')
+
+    assert len(products) == 3
+    for product in products:
+        assert set(product) == {'sku', 'image_url'}
+
+
+def test_fields_projection_without_known_fields(app_module, monkeypatch):
+    """Naming only unknown fields returns full products instead of empty ones"""
+    full = _get_compatible(app_module, monkeypatch, '')
+    products = _get_compatible(app_module, monkeypatch, '?fields=bogus,nope')
+
+    assert products == full
+    assert all(product for product in products)
@@ -0,0 +1,74 @@
+import logging
+import pandas as pd
+import pytest
+
+# Configure logging
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path, monkeypatch):
+    """Point models at an empty SQLite database for the duration of a test"""
+    import models
+
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'products.db'}")
+    monkeypatch.setattr(models, '_engine', None)
+    monkeypatch.setattr(models, '_session_factory', None)
+    engine = models.get_engine()
+    models.Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def _workbook(rows_per_category, version):
+    """Two product sheets whose names change with version, so a second sync updates every row"""
+    return {
+        category: pd.DataFrame({
+            'Unique ID': [f'{prefix}{i:04d}' for i in range(rows_per_category)],
+            'Product Name': [f'{category} {i} {version}' for i in range(rows_per_category)],
+            'Brand': ['MAAX'] * rows_per_category,
+        })
+        for category, prefix in (('Walls', 'WALL'), ('Shower Doors', 'DOOR'))
+    }
+
+
+def _sync_select_count(engine, monkeypatch, workbook):
+    """Run a sync against workbook and count the SELECT statements it sent"""
+    from sqlalchemy import event
+    import data_loader
+    import db_sync_service
+
+    monkeypatch.setattr(data_loader, 'read_excel_workbook', lambda excel_path: workbook)
+    selects = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            selects.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        result = db_sync_service.sync_database_from_excel('Product Data.xlsx')
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+    return result, len(selects)
+
+
+def test_sync_queries_do_not_grow_with_rows(sqlite_engine, monkeypatch):
+    """Updating 10 or 100 products per category sends the same number of SELECTs"""
+    from models import Product
+
+    select_counts = {}
+    for rows_per_category in (10, 100):
+        with sqlite_engine.begin() as conn:
+            conn.execute(Product.__table__.delete())
+
+        _sync_select_count(sqlite_engine, monkeypatch, _workbook(rows_per_category, 'v1'))
+        result, select_counts[rows_per_category] = _sync_select_count(
+            sqlite_engine, monkeypatch, _workbook(rows_per_category, 'v2'))
+
+        assert result['products_added'] == 0
+        assert result['products_updated'] == 2 * rows_per_category
+
+    logger.info(f"SELECTs per sync: {select_counts}")
+    assert select_counts[10] == select_counts[100]
@@ -0,0 +1,49 @@
+import logging
+import redis_cache
+
+# Configure logging
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+SAMPLE_VALUES = [
+    b'',
+    b'{"success": true, "compatibles": []}',
+    'plain text value',
+    b'0123456789abcdef\n' + b'{"sku": "FB03060M"}' * 200,
+]
+
+
+def test_encode_decode_round_trip():
+    """Values read back as the bytes that were stored, compressed or not"""
+    for value in SAMPLE_VALUES:
+        expected = value.encode() if isinstance(value, str) else value
+        assert redis_cache._decode(redis_cache._encode(value)) == expected
+
+
+def test_encode_decode_without_lz4(monkeypatch):
+    """Without lz4, values are stored raw behind their format tag"""
+    monkeypatch.setattr(redis_cache, 'lz4_available', False)
+
+    for value in SAMPLE_VALUES:
+        expected = value.encode() if isinstance(value, str) else value
+        stored = redis_cache._encode(value)
+        assert stored[:1] == redis_cache._FORMAT_RAW
+        assert redis_cache._decode(stored) == expected
+
+
+def test_lz4_values_unreadable_without_lz4(monkeypatch):
+    """A worker without lz4 treats compressed values as cache misses"""
+    if not redis_cache.lz4_available:
+        return
+    stored = redis_cache._encode(b'{"success": true}')
+    assert stored[:1] == redis_cache._FORMAT_LZ4
+
+    monkeypatch.setattr(redis_cache, 'lz4_available', False)
+    assert redis_cache._decode(stored) is None
+
+
+def test_decode_legacy_untagged_values():
+    """Values written before format tags existed are returned unchanged"""
+    # JSON bodies and "<etag>\n<body>" entries, as stored before compression
+    for legacy in [b'{"success": true}', b'[1, 2, 3]', b'0123456789abcdef\n{"success": true}']:
+        assert redis_cache._decode(legacy) == legacy
@@ -0,0 +1,40 @@
+import logging
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+def _suggestions_by_scan(data, query):
+    """The original /suggest Excel fallback: a substring scan of every SKU and name"""
+    sku_product_map = {}
+    for df in data.values():
+        for sku, name in zip(df['Unique ID'].astype(str), df['Product Name'].astype(str)):
+            sku_product_map[sku] = name
+
+    matching_skus_by_id = [sku for sku in sku_product_map if query in sku]
+    matching_skus_by_name = [sku for sku, name in sku_product_map.items() if name and query in name.upper()]
+    matching_skus = sorted(dict.fromkeys(matching_skus_by_id + matching_skus_by_name))[:10]
+
+    display = [f"{sku} - {sku_product_map[sku]}" if sku_product_map[sku] else sku for sku in matching_skus]
+    return tuple(matching_skus), tuple(display)
+
+
+def test_trigram_suggestions_match_substring_scan(app_module):
+    """Trigram candidates confirmed by a substring check give the same suggestions as a full scan"""
+    data = {
+        'Shower Bases': pd.DataFrame({
+            'Unique ID': ['FB03060M', 'FB03660M', 'FB04260M', 'abc123', '410000-501-001'],
+            'Product Name': ['Fibre Base 30x60', 'Fibre Base 36x60', 'Fibre Base 42x60', 'Lower Case', ''],
+        }),
+        'Walls': pd.DataFrame({
+            'Unique ID': [f'WALL{i:03d}' for i in range(15)],
+            'Product Name': [f'Utile Wall Kit {i}' for i in range(15)],
+        }),
+    }
+    suggest_index = app_module.get_suggest_index(data)
+
+    for query in ['FB0', '60M', 'FIBRE', 'BASE 36', 'WALL', 'ALL KIT 1', 'ABC', 'abc', '501-0', 'XYZ', 'LOWER']:
+        expected = _suggestions_by_scan(data, query)
+        assert app_module._excel_suggestions(query, suggest_index['version']) == expected, query
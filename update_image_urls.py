@@ -14,7 +14,7 @@ Usage:
 import sys
 import csv
 import logging
-import pandas as pd
+import openpyxl
 import shutil
 from datetime import datetime
 from models import get_session, Product
@@ -139,47 +139,41 @@ def update_excel_file(updates):
         shutil.copy2(EXCEL_FILE, backup_file)
         logger.info(f"  Created backup: {backup_file}")
         
-        # Read all sheets into memory first (before opening writer)
-        excel_file = pd.ExcelFile(EXCEL_FILE, engine='openpyxl')
-        sheet_names = excel_file.sheet_names
-        logger.info(f"  Processing {len(sheet_names)} sheets...")
+        # Edit the Image URL cells in place; untouched sheets are never re-serialized
+        workbook = openpyxl.load_workbook(EXCEL_FILE)
+        logger.info(f"  Processing {len(workbook.sheetnames)} sheets...")
         
         total_updated = 0
         updated_sheets = {}
         
-        # Load all sheets into memory
-        all_sheets = {}
-        for sheet_name in sheet_names:
-            all_sheets[sheet_name] = pd.read_excel(excel_file, sheet_name=sheet_name)
-        
-        # Close the reader before opening the writer
-        excel_file.close()
-        
-        # Process and write all sheets
-        with pd.ExcelWriter(EXCEL_FILE, engine='xlsxwriter') as writer:
-            for sheet_name in sheet_names:
-                df = all_sheets[sheet_name]
-                
-                # Check if sheet has the required columns
-                if 'Unique ID' not in df.columns or 'Image URL' not in df.columns:
-                    # Write sheet as-is
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
+        for worksheet in workbook.worksheets:
+            header = [cell.value for cell in worksheet[1]]
+            
+            # Check if sheet has the required columns
+            if 'Unique ID' not in header or 'Image URL' not in header:
+                continue
+            
+            sku_col = header.index('Unique ID')
+            url_col = header.index('Image URL')
+            
+            # Update image URLs
+            sheet_updated = 0
+            for row in worksheet.iter_rows(min_row=2):
+                value = row[sku_col].value
+                if value is None:
                     continue
-                
-                # Update image URLs
-                sheet_updated = 0
-                for idx, row in df.iterrows():
-                    sku = str(row['Unique ID']).strip()
-                    if sku in updates:
-                        df.at[idx, 'Image URL'] = updates[sku]
-                        sheet_updated += 1
-                
-                if sheet_updated > 0:
-                    updated_sheets[sheet_name] = sheet_updated
-                    total_updated += sheet_updated
-                
-                # Write updated sheet
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
+                sku = str(value).strip()
+                if sku in updates:
+                    row[url_col].value = updates[sku]
+                    sheet_updated += 1
+            
+            if sheet_updated > 0:
+                updated_sheets[worksheet.title] = sheet_updated
+                total_updated += sheet_updated
+        
+        if total_updated > 0:
+            workbook.save(EXCEL_FILE)
+        workbook.close()
         
         logger.info(f"  ✓ Excel: {total_updated} products updated across {len(updated_sheets)} sheets")
         
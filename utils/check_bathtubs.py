@@ -1,31 +1,38 @@
 #!/usr/bin/env python
-import pandas as pd
+import openpyxl
 
 # Load the Excel file
 try:
     # Try to load the bathtubs and shower bases sheets
     sheets = ['Bathtubs', 'Shower Bases']
     
+    # Read-only mode streams rows, so only the header and first row are parsed
+    workbook = openpyxl.load_workbook('data/Product Data.xlsx', read_only=True, data_only=True)
+    
     print("Checking Excel file for Max Door Width information:")
     for sheet_name in sheets:
         print(f"\n{sheet_name} columns:")
         try:
-            data = pd.read_excel('data/Product Data.xlsx', sheet_name=sheet_name)
-            print(data.columns.tolist())
+            rows = workbook[sheet_name].iter_rows(min_row=1, max_row=2, values_only=True)
+            columns = list(next(rows, ()))
+            first_values = next(rows, None)
+            print(columns)
             
             # Check for any column related to door width
-            width_columns = [col for col in data.columns if 'width' in col.lower() or 'door' in col.lower()]
+            width_columns = [col for col in columns if 'width' in str(col).lower() or 'door' in str(col).lower()]
             if width_columns:
                 print(f"Potential door width columns: {width_columns}")
                 
             # Print first row as sample
-            if not data.empty:
+            if first_values is not None:
                 print("\nSample data (first row):")
-                first_row = data.iloc[0].to_dict()
+                first_row = dict(zip(columns, first_values))
                 for key, value in first_row.items():
                     print(f"  {key}: {value}")
         except Exception as e:
             print(f"Error loading {sheet_name}: {e}")
     
+    workbook.close()
+    
 except Exception as e:
     print(f"Error: {e}")
\ No newline at end of file
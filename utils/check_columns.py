@@ -1,21 +1,28 @@
 #!/usr/bin/env python
-import pandas as pd
+import openpyxl
 
 # List of sheets to check
 sheets = ['Tub Doors', 'Shower Doors']
 
+# Open the workbook once in read-only mode; only the header and first data
+# row are needed, so stream them instead of loading whole sheets
+workbook = openpyxl.load_workbook('data/Product Data.xlsx', read_only=True, data_only=True)
+
 # Load each sheet and print columns
 for sheet in sheets:
     print(f"\n{sheet} columns:")
-    data = pd.read_excel('data/Product Data.xlsx', sheet_name=sheet)
-    print(data.columns.tolist())
+    rows = workbook[sheet].iter_rows(min_row=1, max_row=2, values_only=True)
+    columns = list(next(rows, ()))
+    first_row = dict(zip(columns, next(rows, ())))
+    print(columns)
     
     # Check for Maximum Width column
-    if 'Maximum Width' in data.columns:
-        print(f"Sample Maximum Width value: {data.iloc[0].get('Maximum Width')}")
+    if 'Maximum Width' in columns:
+        print(f"Sample Maximum Width value: {first_row.get('Maximum Width')}")
     
     # Print first row data for debugging
     print(f"\nFirst row sample data:")
-    first_row = data.iloc[0].to_dict()
     for key, value in first_row.items():
-        print(f"  {key}: {value}")
\ No newline at end of file
+        print(f"  {key}: {value}")
+
+workbook.close()
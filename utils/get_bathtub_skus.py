@@ -2,7 +2,8 @@ import pandas as pd
 
 # Load the bathtubs sheet from Excel
 try:
-    df = pd.read_excel('data/Product Data.xlsx', sheet_name='Bathtubs')
+    df = pd.read_excel('data/Product Data.xlsx', sheet_name='Bathtubs',
+                       usecols=['Unique ID', 'Product Name'], nrows=5)
     print("First 5 bathtub SKUs:")
     
     # Extract the first 5 rows